@@ -2,26 +2,113 @@
 Diagnose why the optimization problem is infeasible
 """
 
-import json
-import csv
-from collections import defaultdict
+import os
+import pickle
+import tempfile
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import NamedTuple
+
+import orjson
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+# Parsed cost coverage is cached here between runs (see load_cost_coverage)
+COST_CACHE_FILE = Path('.cache/costs_covered.pkl')
+
+
+class BrandItems(NamedTuple):
+    """Per-brand item counts (a kit counts as one item)"""
+    kits: int
+    standalone: int
+    total_items: int
+    total_books: int
+
+
+def load_cost_coverage(costs_path: str) -> tuple[int, defaultdict]:
+    """
+    Load the (supplier, method) pairs covered by cost entries for each book
+
+    Only the (book, supplier, method) keys are read. The result is pickled to
+    COST_CACHE_FILE keyed by the file's path, mtime and size, so repeated runs
+    skip parsing the costs until the file changes. An unreadable cache is
+    ignored and rewritten.
+
+    Returns:
+        (number of distinct cost entries, book_id -> {(supplier_id, method)})
+    """
+    stat = os.stat(costs_path)
+    cache_key = (costs_path, stat.st_mtime_ns, stat.st_size)
+
+    if COST_CACHE_FILE.exists():
+        try:
+            with open(COST_CACHE_FILE, 'rb') as f:
+                cached = pickle.load(f)
+            if cached['key'] == cache_key:
+                return cached['num_entries'], cached['covered_by_book']
+        except (pickle.UnpicklingError, EOFError, KeyError, AttributeError, TypeError):
+            # A truncated or incompatible cache is rebuilt from the costs below
+            pass
+
+    cost_columns = ['book_id', 'supplier_id', 'printing_method']
+    if costs_path.endswith('.parquet'):
+        cost_table = pq.read_table(costs_path, columns=cost_columns)
+    else:
+        # IDs stay strings (as in DataLoader), so numeric-looking IDs keep leading zeros
+        cost_table = pacsv.read_csv(
+            costs_path,
+            convert_options=pacsv.ConvertOptions(
+                column_types={column: pa.string() for column in cost_columns},
+                include_columns=cost_columns
+            )
+        )
+    costs = frozenset(zip(
+        cost_table['book_id'].to_pylist(),
+        cost_table['supplier_id'].to_pylist(),
+        cost_table['printing_method'].to_pylist()
+    ))
+
+    # Index covered (supplier, method) pairs per book in a single pass over the costs
+    covered_by_book = defaultdict(set)
+    for book_id, supplier_id, method in costs:
+        covered_by_book[book_id].add((supplier_id, method))
+
+    # Written to a temporary file and moved into place, so an interrupted run
+    # never leaves a partial cache behind
+    COST_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=COST_CACHE_FILE.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(
+                {'key': cache_key, 'num_entries': len(costs), 'covered_by_book': covered_by_book},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+        os.replace(tmp_path, COST_CACHE_FILE)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    return len(costs), covered_by_book
+
 
 # Load data
 print("="*80)
 print("INFEASIBILITY DIAGNOSIS")
 print("="*80)
 
-with open('data/test_large/books.json', 'r') as f:
-    books = json.load(f)
+with open('data/test_large/books.json', 'rb') as f:
+    books = orjson.loads(f.read())
 
-with open('data/test_large/kits.json', 'r') as f:
-    kits = json.load(f)
+with open('data/test_large/kits.json', 'rb') as f:
+    kits = orjson.loads(f.read())
 
-with open('data/test_large/suppliers.json', 'r') as f:
-    suppliers = json.load(f)
+with open('data/test_large/suppliers.json', 'rb') as f:
+    suppliers = orjson.loads(f.read())
 
-with open('data/test_large/config.json', 'r') as f:
-    config = json.load(f)
+with open('data/test_large/config.json', 'rb') as f:
+    config = orjson.loads(f.read())
 
 print(f"\nData Summary:")
 print(f"  Books: {len(books)}")
@@ -29,22 +116,64 @@ print(f"  Kits: {len(kits)}")
 print(f"  Suppliers: {len(suppliers)}")
 print(f"  Max items per brand per supplier: {config['max_volumes_per_brand_per_supplier']}")
 
-# Build maps
-book_map = {book['id']: book for book in books}
-kit_map = {kit['id']: kit for kit in kits}
+# Load costs, preferring the Parquet copy written by generate_test_data.py unless
+# costs.csv (the file the solver reads) has been modified since
+costs_path = 'data/test_large/costs.csv'
+parquet_path = 'data/test_large/costs.parquet'
+if (
+    os.path.exists(parquet_path)
+    and os.path.getmtime(parquet_path) >= os.path.getmtime(costs_path)
+):
+    costs_path = parquet_path
+print(f"  Costs file: {costs_path}")
+num_cost_entries, covered_by_book = load_cost_coverage(costs_path)
+
+# A pair only counts if the supplier also has capacity for that method
+supplier_method_pairs = {
+    (supplier['id'], method)
+    for supplier in suppliers
+    for method in supplier['capacities']
+}
+
+# Gather everything the analyses below need in a single pass over the books
+total_volume_by_method = defaultdict(int)
+min_volume_needed = 0
+brand_book_counts = Counter()
+brand_kits = defaultdict(set)
+brand_standalone = Counter()
+books_without_costs = []
+
+for book in books:
+    book_id = book['id']
+    brand = book['brand']
+    volume = book['production_volume']
+    methods = book['available_printing_methods']
+
+    # For capacity analysis, assume each book could use any of its available methods
+    for method in methods:
+        total_volume_by_method[method] += volume
+    min_volume_needed += volume
+
+    # Count kits and standalone books per brand
+    brand_book_counts[brand] += 1
+    kit_id = book.get('kit_id')
+    if kit_id:
+        brand_kits[brand].add(kit_id)
+    else:
+        brand_standalone[brand] += 1
+
+    # Check the book has at least one valid (supplier, method) combination
+    if not any(
+        method in methods
+        for _, method in covered_by_book[book_id] & supplier_method_pairs
+    ):
+        books_without_costs.append(book_id)
 
 # 1. CHECK CAPACITY
 print("\n" + "="*80)
 print("1. CAPACITY ANALYSIS")
 print("="*80)
 
-# Calculate total production volume by method
-total_volume_by_method = defaultdict(int)
-for book in books:
-    # For this analysis, assume each book could use any of its available methods
-    for method in book['available_printing_methods']:
-        total_volume_by_method[method] += book['production_volume']
-
 # Calculate total supplier capacity by method
 total_capacity_by_method = defaultdict(int)
 for supplier in suppliers:
@@ -59,8 +188,7 @@ for method in sorted(total_volume_by_method.keys()):
     status = "[OK]" if demand <= capacity else "[VIOLATION]"
     print(f"  {method:12s}: Demand={demand:,} vs Capacity={capacity:,} (ratio={ratio:.2f}) {status}")
 
-# Calculate actual minimum volume needed
-min_volume_needed = sum(book['production_volume'] for book in books)
+# Compare the actual minimum volume needed against the largest method capacity
 max_capacity = max(total_capacity_by_method.values())
 print(f"\nMinimum volume needed: {min_volume_needed:,}")
 print(f"Maximum capacity (any single method): {max_capacity:,}")
@@ -71,32 +199,19 @@ print("\n" + "="*80)
 print("2. BRAND DISTRIBUTION ANALYSIS")
 print("="*80)
 
-# Count brands
-books_by_brand = defaultdict(list)
-for book in books:
-    books_by_brand[book['brand']].append(book['id'])
-
-# Count kits and standalone books per brand
 brand_items = {}
-for brand, book_ids in books_by_brand.items():
-    kits_with_brand = set()
-    standalone_books = []
-
-    for book_id in book_ids:
-        book = book_map[book_id]
-        if book.get('kit_id'):
-            kits_with_brand.add(book['kit_id'])
-        else:
-            standalone_books.append(book_id)
-
-    brand_items[brand] = {
-        'kits': len(kits_with_brand),
-        'standalone': len(standalone_books),
-        'total_items': len(kits_with_brand) + len(standalone_books),
-        'total_books': len(book_ids)
-    }
-
-print(f"\nBrands: {len(books_by_brand)}")
+for brand, num_books in brand_book_counts.items():
+    num_kits = len(brand_kits[brand])
+    num_standalone = brand_standalone[brand]
+    brand_items[brand] = BrandItems(
+        kits=num_kits,
+        standalone=num_standalone,
+        total_items=num_kits + num_standalone,
+        total_books=num_books
+    )
+sorted_brands = sorted(brand_items)
+
+print(f"\nBrands: {len(brand_book_counts)}")
 print(f"Suppliers: {len(suppliers)}")
 print(f"Max items per brand per supplier: {config['max_volumes_per_brand_per_supplier']}")
 
@@ -111,18 +226,20 @@ print("  (= {max_items} items/supplier × {num_suppliers} suppliers)".format(
 ))
 
 violations = []
-for brand in sorted(brand_items.keys()):
+for brand in sorted_brands:
     items = brand_items[brand]
-    if items['total_items'] > total_slots_available_per_brand:
+    if items.total_items > total_slots_available_per_brand:
         violations.append(brand)
         status = "[VIOLATION]"
     else:
         status = "[OK]"
 
     print(f"\n  {brand}:")
-    print(f"    Items (kits + standalone): {items['total_items']} (needs {items['total_items']} slots, {total_slots_available_per_brand} available) {status}")
-    print(f"    Breakdown: {items['kits']} kits + {items['standalone']} standalone books")
-    print(f"    Total books in this brand: {items['total_books']}")
+    print(f"    Items (kits + standalone): {items.total_items} (needs {items.total_items} slots, {total_slots_available_per_brand} available) {status}")
+    print(f"    Breakdown: {items.kits} kits + {items.standalone} standalone books")
+    print(f"    Total books in this brand: {items.total_books}")
+
+max_violation_items = max((brand_items[b].total_items for b in violations), default=0)
 
 if violations:
     print("\n" + "="*80)
@@ -131,7 +248,7 @@ if violations:
     print(f"\nThe following brands have MORE items than available slots:")
     for brand in violations:
         items = brand_items[brand]
-        print(f"  {brand}: {items['total_items']} items > {total_slots_available_per_brand} slots")
+        print(f"  {brand}: {items.total_items} items > {total_slots_available_per_brand} slots")
     print(f"\nThis makes the problem INFEASIBLE!")
     print(f"\nPossible solutions:")
     print(f"  1. Increase max_volumes_per_brand_per_supplier (currently {max_items_per_supplier})")
@@ -144,32 +261,7 @@ print("\n" + "="*80)
 print("3. COST COVERAGE ANALYSIS")
 print("="*80)
 
-# Load costs
-costs = {}
-with open('data/test_large/costs.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        key = (row['book_id'], row['supplier_id'], row['printing_method'])
-        costs[key] = float(row['unit_cost'])
-
-print(f"Total cost entries: {len(costs)}")
-
-# Check if every book has at least one valid (supplier, method) combination
-books_without_costs = []
-for book in books:
-    has_valid_combo = False
-    for supplier in suppliers:
-        for method in book['available_printing_methods']:
-            if (book['id'], supplier['id'], method) in costs:
-                # Also check if supplier has capacity for this method
-                if method in supplier['capacities']:
-                    has_valid_combo = True
-                    break
-        if has_valid_combo:
-            break
-
-    if not has_valid_combo:
-        books_without_costs.append(book['id'])
+print(f"Total cost entries: {num_cost_entries}")
 
 if books_without_costs:
     print(f"\n[VIOLATION] Books without valid (supplier, method) combinations: {len(books_without_costs)}")
@@ -185,7 +277,7 @@ print("="*80)
 if violations:
     print("\nPROBLEM IS INFEASIBLE DUE TO BRAND CONSTRAINT")
     print(f"\n{len(violations)} brand(s) have more items than can be distributed across suppliers.")
-    print(f"\nRecommended fix: Increase 'max_volumes_per_brand_per_supplier' from {max_items_per_supplier} to at least {max(brand_items[b]['total_items'] for b in violations) // len(suppliers) + 1}")
+    print(f"\nRecommended fix: Increase 'max_volumes_per_brand_per_supplier' from {max_items_per_supplier} to at least {max_violation_items // len(suppliers) + 1}")
 elif books_without_costs:
     print("\nPROBLEM MAY BE INFEASIBLE DUE TO MISSING COSTS")
     print(f"\n{len(books_without_costs)} book(s) don't have valid (supplier, method) combinations")
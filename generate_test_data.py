@@ -9,12 +9,18 @@ This script generates realistic printing optimization data with:
 - Brand distribution across books
 """
 
-import json
 import random
-import csv
+import zlib
+from collections import Counter
 from pathlib import Path
 from typing import List, Dict
 
+import numpy as np
+import orjson
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
 # Configuration
 NUM_BOOKS = 1500
 NUM_SUPPLIERS = 20
@@ -23,9 +29,11 @@ NUM_KITS = 225
 BOOKS_PER_KIT_MIN = 2
 BOOKS_PER_KIT_MAX = 15
 PRINTING_METHODS = ["offset", "digital", "hybrid"]
+INDENT_JSON = True  # Set to False for compact (smaller, faster to write) JSON files
 
 # Random seed for reproducibility
 random.seed(42)
+rng = np.random.default_rng(42)
 
 # Brand names
 BRAND_PREFIXES = [
@@ -78,60 +86,57 @@ def generate_brands() -> List[str]:
 
 def generate_books(brands: List[str]) -> List[Dict]:
     """Generate book data"""
-    books = []
+    # Draw every random attribute in one batch per attribute
+    title_prefixes = random.choices(TITLE_PREFIXES, k=NUM_BOOKS)
+    title_topics = random.choices(TITLE_TOPICS, k=NUM_BOOKS)
+    has_volume_number = rng.random(NUM_BOOKS) < 0.3  # 30% chance of volume number
+    volume_numbers = rng.integers(1, 6, size=NUM_BOOKS)
+    book_brands = random.choices(brands, k=NUM_BOOKS)
+
+    # Production volume (realistic distribution)
+    # Most books: 1000-5000, some small runs: 100-1000, few large: 5000-10000
+    run_type = rng.random(NUM_BOOKS)
+    production_volumes = np.select(
+        [run_type < 0.7, run_type < 0.9],  # 70% medium runs, 20% small runs
+        [rng.integers(500, 2001, NUM_BOOKS), rng.integers(100, 1001, NUM_BOOKS)],
+        rng.integers(100, 2001, NUM_BOOKS)  # 10% large runs
+    ).astype(np.int32)
+    method_choices = rng.integers(0, 3, size=NUM_BOOKS)
+
+    # Available printing methods
+    # Small volumes (<1000): prefer digital
+    # Medium volumes (1000-5000): both offset and digital
+    # Large volumes (>5000): prefer offset, maybe hybrid
+    small_volume_methods = [["digital"], ["digital", "hybrid"], ["digital", "offset"]]
+    medium_volume_methods = [["offset", "digital"], ["offset", "digital", "hybrid"], ["offset", "digital"]]
+    large_volume_methods = [["offset"], ["offset", "hybrid"], ["offset", "digital", "hybrid"]]
+
+    # Convert to plain Python values once so the JSON output holds ints/bools
+    has_volume_number = has_volume_number.tolist()
+    volume_numbers = volume_numbers.tolist()
+    production_volumes = production_volumes.tolist()
+    method_choices = method_choices.tolist()
 
+    books = []
     for i in range(NUM_BOOKS):
-        book_id = f"B{i+1:05d}"
-
-        # Generate title
-        prefix = random.choice(TITLE_PREFIXES)
-        topic = random.choice(TITLE_TOPICS)
-        title = f"{prefix} {topic}"
-        if random.random() < 0.3:  # 30% chance of volume number
-            title += f" Vol. {random.randint(1, 5)}"
-
-        # Assign brand
-        brand = random.choice(brands)
-
-        # Production volume (realistic distribution)
-        # Most books: 1000-5000, some small runs: 100-1000, few large: 5000-10000
-        rand = random.random()
-        if rand < 0.7:  # 70% medium runs
-            production_volume = random.randint(500, 2000)
-        elif rand < 0.9:  # 20% small runs
-            production_volume = random.randint(100, 1000)
-        else:  # 10% large runs
-            production_volume = random.randint(100, 2000)
-
-        # Available printing methods
-        # Small volumes (<1000): prefer digital
-        # Medium volumes (1000-5000): both offset and digital
-        # Large volumes (>5000): prefer offset, maybe hybrid
+        title = f"{title_prefixes[i]} {title_topics[i]}"
+        if has_volume_number[i]:
+            title += f" Vol. {volume_numbers[i]}"
+
+        production_volume = production_volumes[i]
         if production_volume < 1000:
-            available_methods = random.choice([
-                ["digital"],
-                ["digital", "hybrid"],
-                ["digital", "offset"]
-            ])
+            method_options = small_volume_methods
         elif production_volume < 5000:
-            available_methods = random.choice([
-                ["offset", "digital"],
-                ["offset", "digital", "hybrid"],
-                ["offset", "digital"]
-            ])
+            method_options = medium_volume_methods
         else:
-            available_methods = random.choice([
-                ["offset"],
-                ["offset", "hybrid"],
-                ["offset", "digital", "hybrid"]
-            ])
+            method_options = large_volume_methods
 
         books.append({
-            "id": book_id,
+            "id": f"B{i+1:05d}",
             "title": title,
-            "brand": brand,
+            "brand": book_brands[i],
             "production_volume": production_volume,
-            "available_printing_methods": available_methods,
+            "available_printing_methods": list(method_options[method_choices[i]]),
             "kit_id": None  # Will be assigned later
         })
 
@@ -205,69 +210,105 @@ def generate_suppliers() -> List[Dict]:
     return suppliers
 
 
-def generate_costs(books: List[Dict], suppliers: List[Dict]) -> List[List]:
-    """Generate cost data"""
-    costs = []
+def _sample_unit_costs(volumes: np.ndarray, supplier_factors: np.ndarray) -> np.ndarray:
+    """
+    Sample unit costs for every (book, supplier, method) cell
+
+    Pure numeric kernel: takes per-book volumes and per-supplier factors and
+    returns a (books, suppliers, PRINTING_METHODS) array of rounded unit costs.
+    """
+    num_books = len(volumes)
+    num_suppliers = len(supplier_factors)
+
+    # Base unit cost range (low, high) per book, depending on method and volume
+    base_cost_ranges = {
+        # Offset: cheaper for large volumes, setup cost amortized
+        "offset": (
+            np.select([volumes < 1000, volumes < 5000], [3.0, 2.0], 1.5),
+            np.select([volumes < 1000, volumes < 5000], [4.5, 3.0], 2.5),
+        ),
+        # Digital: consistent cost regardless of volume
+        "digital": (np.full(num_books, 2.5), np.full(num_books, 3.5)),
+        # Hybrid: between offset and digital
+        "hybrid": (
+            np.where(volumes < 2000, 2.8, 2.2),
+            np.where(volumes < 2000, 3.8, 3.2),
+        ),
+    }
 
-    for book in books:
-        for supplier in suppliers:
-            for method in book["available_printing_methods"]:
-                # Base cost depends on printing method and volume
-                volume = book["production_volume"]
-
-                # Base unit costs
-                if method == "offset":
-                    # Offset: cheaper for large volumes, setup cost amortized
-                    if volume < 1000:
-                        base_cost = random.uniform(3.0, 4.5)
-                    elif volume < 5000:
-                        base_cost = random.uniform(2.0, 3.0)
-                    else:
-                        base_cost = random.uniform(1.5, 2.5)
-                elif method == "digital":
-                    # Digital: consistent cost regardless of volume
-                    base_cost = random.uniform(2.5, 3.5)
-                else:  # hybrid
-                    # Hybrid: between offset and digital
-                    if volume < 2000:
-                        base_cost = random.uniform(2.8, 3.8)
-                    else:
-                        base_cost = random.uniform(2.2, 3.2)
-
-                # Add supplier-specific variation (+/- 15%)
-                supplier_factor = 0.85 + (hash(supplier["id"]) % 30) / 100
-                unit_cost = base_cost * supplier_factor
-
-                # Round to 2 decimal places
-                unit_cost = round(unit_cost, 2)
-
-                costs.append([book["id"], supplier["id"], method, unit_cost])
-
-    return costs
-
-
-def save_data(books: List[Dict], kits: List[Dict], suppliers: List[Dict], costs: List[List]):
+    base_costs = np.empty((num_books, num_suppliers, len(PRINTING_METHODS)))
+    for m, method in enumerate(PRINTING_METHODS):
+        low, high = base_cost_ranges[method]
+        base_costs[:, :, m] = rng.uniform(
+            low[:, None], high[:, None], size=(num_books, num_suppliers)
+        )
+
+    # Apply supplier-specific variation and round to 2 decimal places
+    return np.round(base_costs * supplier_factors[None, :, None], 2)
+
+
+def generate_costs(books: List[Dict], suppliers: List[Dict]) -> Dict[str, np.ndarray]:
+    """Generate cost data as columns (one row per book, supplier and available method)"""
+    volumes = np.array([book["production_volume"] for book in books], dtype=np.int32)
+
+    # Add supplier-specific variation (+/- 15%), derived from a stable checksum of
+    # the supplier id so it does not change with Python's per-process hash seed
+    supplier_factors = np.array([
+        0.85 + (zlib.crc32(s["id"].encode()) % 30) / 100 for s in suppliers
+    ])
+
+    unit_costs = _sample_unit_costs(volumes, supplier_factors)
+
+    # Keep only the methods each book supports (rows come out book-major)
+    method_mask = np.array([
+        [method in book["available_printing_methods"] for method in PRINTING_METHODS]
+        for book in books
+    ])
+    book_idx, supplier_idx, method_idx = np.nonzero(
+        np.broadcast_to(method_mask[:, None, :], unit_costs.shape)
+    )
+
+    return {
+        "book_id": np.array([book["id"] for book in books])[book_idx],
+        "supplier_id": np.array([s["id"] for s in suppliers])[supplier_idx],
+        "printing_method": np.array(PRINTING_METHODS)[method_idx],
+        # float32 is plenty for 2-decimal prices and halves the Parquet column
+        "unit_cost": unit_costs[book_idx, supplier_idx, method_idx].astype(np.float32),
+    }
+
+
+def _write_json(path: Path, obj) -> None:
+    """Serialize obj to path with orjson, indented unless INDENT_JSON is off"""
+    option = orjson.OPT_INDENT_2 if INDENT_JSON else 0
+    path.write_bytes(orjson.dumps(obj, option=option))
+
+
+def save_data(books: List[Dict], kits: List[Dict], suppliers: List[Dict], costs: Dict[str, np.ndarray]):
     """Save generated data to files"""
     output_dir = Path("data/test_large")
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Save books
-    with open(output_dir / "books.json", 'w', encoding='utf-8') as f:
-        json.dump(books, f, indent=2)
+    _write_json(output_dir / "books.json", books)
 
     # Save kits
-    with open(output_dir / "kits.json", 'w', encoding='utf-8') as f:
-        json.dump(kits, f, indent=2)
+    _write_json(output_dir / "kits.json", kits)
 
     # Save suppliers
-    with open(output_dir / "suppliers.json", 'w', encoding='utf-8') as f:
-        json.dump(suppliers, f, indent=2)
+    _write_json(output_dir / "suppliers.json", suppliers)
+
+    # Save costs as CSV (header written by hand so it stays unquoted)
+    cost_table = pa.table(costs)
+    with open(output_dir / "costs.csv", 'wb') as f:
+        f.write(b"book_id,supplier_id,printing_method,unit_cost\n")
+        pacsv.write_csv(
+            cost_table,
+            f,
+            pacsv.WriteOptions(include_header=False, batch_size=8192, quoting_style='none')
+        )
 
-    # Save costs as CSV
-    with open(output_dir / "costs.csv", 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow(['book_id', 'supplier_id', 'printing_method', 'unit_cost'])
-        writer.writerows(costs)
+    # Also save costs as Parquet for columnar consumers (e.g. diagnose_infeasibility.py)
+    pq.write_table(cost_table, output_dir / "costs.parquet")
 
     # Save config
     config = {
@@ -276,8 +317,18 @@ def save_data(books: List[Dict], kits: List[Dict], suppliers: List[Dict], costs:
         "num_search_workers": 8,
         "enable_symmetry_breaking": True
     }
-    with open(output_dir / "config.json", 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2)
+    _write_json(output_dir / "config.json", config)
+
+    # Gather book statistics; kit membership comes from the kits
+    volumes = np.fromiter(
+        (book["production_volume"] for book in books), dtype=np.int32, count=len(books)
+    )
+    brands = set()
+    method_counts = Counter()
+    for book in books:
+        brands.add(book["brand"])
+        method_counts.update(book["available_printing_methods"])
+    books_in_kits = sum(len(kit["book_ids"]) for kit in kits)
 
     print(f"\n{'='*60}")
     print("Test Data Generation Complete!")
@@ -286,27 +337,20 @@ def save_data(books: List[Dict], kits: List[Dict], suppliers: List[Dict], costs:
     print(f"\nStatistics:")
     print(f"  Books:              {len(books):,}")
     print(f"  Kits:               {len(kits):,}")
-    print(f"  Books in kits:      {sum(1 for b in books if b['kit_id'] is not None):,}")
+    print(f"  Books in kits:      {books_in_kits:,}")
     print(f"  Suppliers:          {len(suppliers):,}")
-    print(f"  Cost entries:       {len(costs):,}")
-    print(f"  Brands:             {len(set(b['brand'] for b in books)):,}")
+    print(f"  Cost entries:       {len(costs['unit_cost']):,}")
+    print(f"  Brands:             {len(brands):,}")
 
     # Volume statistics
-    volumes = [b["production_volume"] for b in books]
-    total_volume = sum(volumes)
+    total_volume = int(volumes.sum(dtype=np.int64))
     avg_volume = total_volume / len(volumes)
 
     print(f"\nProduction Volume:")
     print(f"  Total:              {total_volume:,}")
     print(f"  Average per book:   {avg_volume:,.0f}")
-    print(f"  Min:                {min(volumes):,}")
-    print(f"  Max:                {max(volumes):,}")
-
-    # Method distribution
-    method_counts = {}
-    for book in books:
-        for method in book["available_printing_methods"]:
-            method_counts[method] = method_counts.get(method, 0) + 1
+    print(f"  Min:                {int(volumes.min()):,}")
+    print(f"  Max:                {int(volumes.max()):,}")
 
     print(f"\nPrinting Methods:")
     for method, count in sorted(method_counts.items()):
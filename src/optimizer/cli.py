@@ -1,11 +1,16 @@
 """Command-line interface for the optimization solver"""
 
-import json
+from collections import Counter
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
 import typer
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 
 from .data_loader import DataLoader
@@ -58,13 +63,18 @@ def solve(
         None,
         "--output",
         "-o",
-        help="Path to save results JSON file"
+        help="Path to save results (JSON, or Parquet if it ends in .parquet)"
     ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
         "-v",
         help="Show detailed output"
+    ),
+    compact_json: bool = typer.Option(
+        False,
+        "--compact-json",
+        help="Save results JSON without indentation (faster for large solutions)"
     )
 ):
     """
@@ -99,20 +109,37 @@ def solve(
         console.print(f"  • Cost entries: {len(data.costs)}\n")
 
         # Build and solve model
-        console.print("[bold]Building optimization model...[/bold]")
         solver = SupplierAllocationSolver(data)
-        solver.build_model()
-        console.print("[green][OK][/green] Model built successfully\n")
-
-        console.print("[bold]Solving...[/bold]")
-        result = solver.solve()
+        result = None
+        if data.config.enable_lp_fast_path:
+            console.print("[bold]Trying LP fast path...[/bold]")
+            result = solver.solve_fast()
+            if result is None:
+                console.print("  • Not applicable, falling back to CP-SAT\n")
+            else:
+                console.print("[green][OK][/green] LP solution is integral\n")
+
+        if result is None:
+            console.print("[bold]Building optimization model...[/bold]")
+            solver.build_model()
+            if solver.num_pruned_options:
+                console.print(f"  • Pruned dominated options: {solver.num_pruned_options:,}")
+            console.print("[green][OK][/green] Model built successfully\n")
+
+            console.print("[bold]Solving...[/bold]")
+            result = solver.solve()
+            if result.status == "INFEASIBLE" and solver.num_pruned_options:
+                console.print(
+                    "[yellow]Dominance pruning is enabled; the pruned model may be infeasible "
+                    "even if the full one is not. Retry with enable_dominance_pruning off.[/yellow]"
+                )
 
         # Display results
         _display_results(result, data, verbose)
 
         # Save results if output file specified
         if output_file:
-            _save_results(result, output_file, solver)
+            _save_results(result, output_file, solver, compact=compact_json)
             console.print(f"\n[green][OK][/green] Results saved to {output_file}")
 
     except Exception as e:
@@ -134,19 +161,21 @@ def _display_results(result: OptimizationResult, data, verbose: bool):
         # Assignments by supplier
         console.print(f"\n[bold]Assignments by Supplier:[/bold]\n")
 
-        assignments_by_supplier = {}
-        for assignment in result.assignments:
-            if assignment.supplier_id not in assignments_by_supplier:
-                assignments_by_supplier[assignment.supplier_id] = []
-            assignments_by_supplier[assignment.supplier_id].append(assignment)
+        supplier_by_id = {s.id: s for s in data.suppliers}
+        # One C-keyed sort orders suppliers and the books within each supplier
+        sorted_assignments = sorted(result.assignments, key=attrgetter('supplier_id', 'book_id'))
 
-        for supplier_id, assignments in sorted(assignments_by_supplier.items()):
-            supplier = next(s for s in data.suppliers if s.id == supplier_id)
+        # Collect all supplier sections and render them with a single console.print
+        renderables = []
+        lines = []
+        for supplier_id, group in groupby(sorted_assignments, key=attrgetter('supplier_id')):
+            assignments = list(group)
+            supplier = supplier_by_id[supplier_id]
             total_cost = sum(a.total_cost for a in assignments)
             total_volume = sum(a.production_volume for a in assignments)
 
-            console.print(f"[bold cyan]{supplier.name}[/bold cyan] ({supplier_id})")
-            console.print(f"  Books: {len(assignments)} | Volume: {total_volume:,} | Cost: ${total_cost:,.2f}")
+            lines.append(f"[bold cyan]{supplier.name}[/bold cyan] ({supplier_id})")
+            lines.append(f"  Books: {len(assignments)} | Volume: {total_volume:,} | Cost: ${total_cost:,.2f}")
 
             if verbose:
                 # Show individual book assignments
@@ -157,7 +186,7 @@ def _display_results(result: OptimizationResult, data, verbose: bool):
                 table.add_column("Unit Cost", justify="right")
                 table.add_column("Total Cost", justify="right")
 
-                for assignment in sorted(assignments, key=lambda a: a.book_id):
+                for assignment in assignments:
                     table.add_row(
                         assignment.book_id,
                         assignment.printing_method,
@@ -166,24 +195,38 @@ def _display_results(result: OptimizationResult, data, verbose: bool):
                         f"${assignment.total_cost:,.2f}"
                     )
 
-                console.print(table)
+                renderables.append("\n".join(lines))
+                renderables.append(table)
+                lines = []
 
             # Show utilization
             if supplier_id in result.supplier_utilization:
-                console.print("  Utilization:")
+                lines.append("  Utilization:")
                 for method, util_pct in result.supplier_utilization[supplier_id].items():
-                    console.print(f"    • {method}: {util_pct:.1f}%")
+                    lines.append(f"    • {method}: {util_pct:.1f}%")
 
-            console.print()
+            lines.append("")
+
+        renderables.append("\n".join(lines))
+        console.print(Group(*renderables))
 
     else:
         console.print("[yellow]No solution found[/yellow]")
 
 
-def _save_results(result: OptimizationResult, output_file: Path, solver: SupplierAllocationSolver):
-    """Save results to JSON file"""
+def _save_results(
+    result: OptimizationResult,
+    output_file: Path,
+    solver: SupplierAllocationSolver,
+    compact: bool = False
+):
+    """Save results to JSON file (indented unless compact is set), or Parquet for .parquet paths"""
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
+    if output_file.suffix == ".parquet":
+        _save_results_parquet(result, output_file)
+        return
+
     # Prepare detailed results
     results_dict = {
         "status": result.status,
@@ -205,8 +248,36 @@ def _save_results(result: OptimizationResult, output_file: Path, solver: Supplie
         "supplier_utilization": result.supplier_utilization
     }
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(results_dict, f, indent=2)
+    option = 0 if compact else orjson.OPT_INDENT_2
+    output_file.write_bytes(orjson.dumps(results_dict, option=option))
+
+
+def _save_results_parquet(result: OptimizationResult, output_file: Path):
+    """Save assignments as a Parquet table, with the solution summary in the schema metadata"""
+    assignments = result.assignments
+    table = pa.table({
+        "book_id": pa.array([a.book_id for a in assignments], pa.string()),
+        "supplier_id": pa.array([a.supplier_id for a in assignments], pa.string()),
+        "printing_method": pa.array([a.printing_method for a in assignments], pa.string()),
+        "production_volume": pa.array([a.production_volume for a in assignments], pa.int32()),
+        "unit_cost": pa.array([a.unit_cost for a in assignments], pa.float64()),
+        "total_cost": pa.array([a.total_cost for a in assignments], pa.float64())
+    })
+
+    # Scalars and utilization are stored as JSON-encoded metadata values
+    summary = {
+        "status": result.status,
+        "objective_value": result.objective_value,
+        "solve_time_seconds": result.solve_time_seconds,
+        "total_books": result.total_books,
+        "total_volume": result.total_volume,
+        "supplier_utilization": result.supplier_utilization
+    }
+    table = table.replace_schema_metadata(
+        {key: orjson.dumps(value) for key, value in summary.items()}
+    )
+
+    pq.write_table(table, output_file, compression="snappy")
 
 
 @app.command()
@@ -236,23 +307,19 @@ def validate(
         console.print(f"  • Suppliers: {len(data.suppliers)}")
         console.print(f"  • Cost entries: {len(data.costs)}")
 
-        # Brand distribution
-        brands = {}
+        # Brand distribution and available printing methods, counted in one pass
+        brands = Counter()
+        methods = Counter()
         for book in data.books:
-            brands[book.brand] = brands.get(book.brand, 0) + 1
+            brands[book.brand] += 1
+            methods.update(book.available_printing_methods)
 
         console.print(f"\n[bold]Books by Brand:[/bold]")
         for brand, count in sorted(brands.items()):
             console.print(f"  • {brand}: {count}")
 
-        # Available printing methods
-        all_methods = set()
-        for book in data.books:
-            all_methods.update(book.available_printing_methods)
-
         console.print(f"\n[bold]Available Printing Methods:[/bold]")
-        for method in sorted(all_methods):
-            count = sum(1 for book in data.books if method in book.available_printing_methods)
+        for method, count in sorted(methods.items()):
             console.print(f"  • {method}: {count} books can use this method")
 
     except Exception as e:
@@ -1,13 +1,33 @@
 """Data loading and validation utilities"""
 
-import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Set
 
+import orjson
 import pandas as pd
+from pydantic import TypeAdapter
 
 from .models import Book, Kit, Supplier, Cost, OptimizationConfig, ProblemData
 
+# Cost CSV columns and the dtypes they are parsed with
+COST_COLUMNS = ['book_id', 'supplier_id', 'printing_method', 'unit_cost']
+COST_DTYPES = {
+    'book_id': str,
+    'supplier_id': str,
+    'printing_method': str,
+    'unit_cost': 'float64'
+}
+
+# Parse, validate and build the model lists in a single pydantic-core pass
+_BOOKS_ADAPTER = TypeAdapter(List[Book])
+_KITS_ADAPTER = TypeAdapter(List[Kit])
+_SUPPLIERS_ADAPTER = TypeAdapter(List[Supplier])
+
+# Shared default configuration (OptimizationConfig is frozen)
+_DEFAULT_CONFIG = OptimizationConfig()
+
 
 class DataLoader:
     """Loads and validates optimization problem data from files"""
@@ -15,46 +35,87 @@ class DataLoader:
     @staticmethod
     def load_books(file_path: str | Path) -> List[Book]:
         """Load books from JSON file"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return [Book(**book_data) for book_data in data]
+        return _BOOKS_ADAPTER.validate_json(Path(file_path).read_bytes())
 
     @staticmethod
     def load_kits(file_path: str | Path) -> List[Kit]:
         """Load kits from JSON file"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return [Kit(**kit_data) for kit_data in data]
+        return _KITS_ADAPTER.validate_json(Path(file_path).read_bytes())
 
     @staticmethod
     def load_suppliers(file_path: str | Path) -> List[Supplier]:
         """Load suppliers from JSON file"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return [Supplier(**supplier_data) for supplier_data in data]
+        return _SUPPLIERS_ADAPTER.validate_json(Path(file_path).read_bytes())
 
     @staticmethod
     def load_costs_from_csv(file_path: str | Path) -> List[Cost]:
-        """Load costs from CSV file"""
-        df = pd.read_csv(file_path)
+        """
+        Load costs from CSV file
+
+        Columns are parsed with explicit dtypes and validated/normalized as a
+        whole, so the Cost models can be built without per-row validation.
+        """
+        df = pd.read_csv(
+            file_path,
+            usecols=COST_COLUMNS,
+            dtype=COST_DTYPES,
+            engine='c'
+        )
+        return DataLoader._costs_from_frame(df, file_path)
+
+    @staticmethod
+    def _costs_from_frame(df: pd.DataFrame, file_path: str | Path) -> List[Cost]:
+        """Validate and normalize a frame of cost rows and build the Cost models"""
+        if df.isna().any(axis=None):
+            raise ValueError(f"Cost file {file_path} has missing values")
+
+        non_positive = df['unit_cost'] <= 0
+        if non_positive.any():
+            row = df[non_positive].iloc[0]
+            raise ValueError(
+                f"Unit cost must be positive, got {row['unit_cost']} for book "
+                f"{row['book_id']} at supplier {row['supplier_id']}"
+            )
+
+        # Same normalization as the Cost.printing_method validator
+        methods = df['printing_method'].str.lower().str.strip()
+
+        # A repeated (book, supplier, method) key would silently overwrite the
+        # earlier cost in the cost matrix
+        duplicated = pd.DataFrame({
+            'book_id': df['book_id'],
+            'supplier_id': df['supplier_id'],
+            'printing_method': methods
+        }).duplicated()
+        if duplicated.any():
+            row = df[duplicated].iloc[0]
+            raise ValueError(
+                f"Duplicate cost entry for book {row['book_id']} at supplier "
+                f"{row['supplier_id']} using method '{methods[duplicated].iloc[0]}'"
+            )
+
         return [
-            Cost(
-                book_id=row['book_id'],
-                supplier_id=row['supplier_id'],
-                printing_method=row['printing_method'],
-                unit_cost=row['unit_cost']
+            Cost.model_construct(
+                book_id=book_id,
+                supplier_id=supplier_id,
+                printing_method=method,
+                unit_cost=unit_cost
+            )
+            for book_id, supplier_id, method, unit_cost in zip(
+                df['book_id'].tolist(),
+                df['supplier_id'].tolist(),
+                methods.tolist(),
+                df['unit_cost'].tolist()
             )
-            for _, row in df.iterrows()
         ]
 
     @staticmethod
     def load_config(file_path: str | Path | None = None) -> OptimizationConfig:
         """Load configuration from JSON file or use defaults"""
         if file_path is None:
-            return OptimizationConfig()
+            return _DEFAULT_CONFIG
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = orjson.loads(Path(file_path).read_bytes())
         return OptimizationConfig(**data)
 
     @classmethod
@@ -82,14 +143,22 @@ class DataLoader:
         Raises:
             ValueError: If data is invalid or inconsistent
         """
-        books = cls.load_books(books_file)
-        kits = cls.load_kits(kits_file)
-        suppliers = cls.load_suppliers(suppliers_file)
-        costs = cls.load_costs_from_csv(costs_file)
-        config = cls.load_config(config_file)
-
-        # Create ProblemData (Pydantic will validate)
-        problem_data = ProblemData(
+        # The loads are independent and spend most of their time in I/O and
+        # C parsers that release the GIL, so run them concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            books_future = executor.submit(cls.load_books, books_file)
+            kits_future = executor.submit(cls.load_kits, kits_file)
+            suppliers_future = executor.submit(cls.load_suppliers, suppliers_file)
+            costs_future = executor.submit(cls.load_costs_from_csv, costs_file)
+            config = cls.load_config(config_file)
+
+            books = books_future.result()
+            kits = kits_future.result()
+            suppliers = suppliers_future.result()
+            costs = costs_future.result()
+
+        # Components are already validated; uniqueness is checked below
+        problem_data = ProblemData.model_construct(
             books=books,
             kits=kits,
             suppliers=suppliers,
@@ -110,42 +179,62 @@ class DataLoader:
         Raises:
             ValueError: If data is inconsistent
         """
-        book_ids = {book.id for book in data.books}
-        supplier_ids = {supplier.id for supplier in data.suppliers}
-        book_map = {book.id: book for book in data.books}
+        # Id sets are views over the cached maps, shared with later lookups
+        book_map = DataLoader.get_book_map(data)
+        book_ids = book_map.keys()
+        supplier_ids = DataLoader.get_supplier_map(data).keys()
+
+        # A map shorter than its list means an id was repeated
+        if len(book_ids) != len(data.books):
+            raise ValueError("Duplicate book IDs found")
+        if len({kit.id for kit in data.kits}) != len(data.kits):
+            raise ValueError("Duplicate kit IDs found")
+        if len(supplier_ids) != len(data.suppliers):
+            raise ValueError("Duplicate supplier IDs found")
 
         # Validate kit book references
-        for kit in data.kits:
-            for book_id in kit.book_ids:
-                if book_id not in book_ids:
-                    raise ValueError(
-                        f"Kit {kit.id} references non-existent book {book_id}"
-                    )
+        kit_book_counts = Counter(
+            book_id for kit in data.kits for book_id in kit.book_ids
+        )
+        missing_kit_books = kit_book_counts.keys() - book_ids
+        if missing_kit_books:
+            raise ValueError(
+                f"Kits reference non-existent books: {', '.join(sorted(missing_kit_books))}"
+            )
 
         # Validate cost references
-        cost_book_ids = set()
-        cost_supplier_ids = set()
-        for cost in data.costs:
-            if cost.book_id not in book_ids:
-                raise ValueError(
-                    f"Cost entry references non-existent book {cost.book_id}"
-                )
-            if cost.supplier_id not in supplier_ids:
-                raise ValueError(
-                    f"Cost entry references non-existent supplier {cost.supplier_id}"
-                )
-
-            # Validate that the printing method is available for the book
-            book = book_map[cost.book_id]
-            if cost.printing_method not in book.available_printing_methods:
-                raise ValueError(
-                    f"Cost entry for book {cost.book_id} references printing method "
-                    f"'{cost.printing_method}' which is not in the book's available methods: "
-                    f"{book.available_printing_methods}"
-                )
-
-            cost_book_ids.add(cost.book_id)
-            cost_supplier_ids.add(cost.supplier_id)
+        cost_book_ids = {cost.book_id for cost in data.costs}
+        cost_supplier_ids = {cost.supplier_id for cost in data.costs}
+
+        unknown_books = cost_book_ids - book_ids
+        if unknown_books:
+            raise ValueError(
+                f"Cost entries reference non-existent books: {', '.join(sorted(unknown_books))}"
+            )
+        unknown_suppliers = cost_supplier_ids - supplier_ids
+        if unknown_suppliers:
+            raise ValueError(
+                "Cost entries reference non-existent suppliers: "
+                f"{', '.join(sorted(unknown_suppliers))}"
+            )
+
+        # Validate that the printing method is available for the book
+        available_book_methods = {
+            (book.id, method)
+            for book in data.books
+            for method in book.available_printing_methods
+        }
+        invalid_book_methods = (
+            {(cost.book_id, cost.printing_method) for cost in data.costs}
+            - available_book_methods
+        )
+        if invalid_book_methods:
+            book_id, method = min(invalid_book_methods)
+            raise ValueError(
+                f"Cost entry for book {book_id} references printing method "
+                f"'{method}' which is not in the book's available methods: "
+                f"{book_map[book_id].available_printing_methods}"
+            )
 
         # Check that all books have at least one cost entry
         books_without_costs = book_ids - cost_book_ids
@@ -155,15 +244,16 @@ class DataLoader:
             )
 
         # Validate kit book assignments
-        kit_book_assignments: Dict[str, str] = {}
-        for kit in data.kits:
-            for book_id in kit.book_ids:
-                if book_id in kit_book_assignments:
-                    raise ValueError(
-                        f"Book {book_id} appears in multiple kits: "
-                        f"{kit_book_assignments[book_id]} and {kit.id}"
-                    )
-                kit_book_assignments[book_id] = kit.id
+        books_in_multiple_kits = sorted(
+            book_id for book_id, count in kit_book_counts.items() if count > 1
+        )
+        if books_in_multiple_kits:
+            raise ValueError(
+                f"Books appear in multiple kits: {', '.join(books_in_multiple_kits)}"
+            )
+        kit_book_assignments: Dict[str, str] = {
+            book_id: kit.id for kit in data.kits for book_id in kit.book_ids
+        }
 
         # Validate books' kit_id matches actual kit membership
         for book in data.books:
@@ -179,47 +269,54 @@ class DataLoader:
                         f"claims {book.kit_id} but is in {kit_book_assignments[book.id]}"
                     )
 
-        # Validate that each book has at least one valid (supplier, method) combination
-        for book in data.books:
-            valid_combinations = [
-                cost for cost in data.costs
-                if cost.book_id == book.id
-            ]
-            if not valid_combinations:
-                raise ValueError(
-                    f"Book {book.id} has no valid cost entries for any supplier/method combination"
-                )
-
     @staticmethod
-    def get_books_by_kit(data: ProblemData) -> Dict[str, List[Book]]:
-        """Group books by kit ID"""
-        books_by_kit: Dict[str, List[Book]] = {}
-        book_map = {book.id: book for book in data.books}
+    def get_book_map(data: ProblemData) -> Dict[str, Book]:
+        """Map book IDs to books (cached on the ProblemData instance)"""
+        if data._book_map is None:
+            data._book_map = {book.id: book for book in data.books}
+        return data._book_map
 
-        for kit in data.kits:
-            books_by_kit[kit.id] = [book_map[book_id] for book_id in kit.book_ids]
+    @staticmethod
+    def get_supplier_map(data: ProblemData) -> Dict[str, Supplier]:
+        """Map supplier IDs to suppliers (cached on the ProblemData instance)"""
+        if data._supplier_map is None:
+            data._supplier_map = {supplier.id: supplier for supplier in data.suppliers}
+        return data._supplier_map
 
-        return books_by_kit
+    @staticmethod
+    def get_books_by_kit(data: ProblemData) -> Dict[str, List[Book]]:
+        """Group books by kit ID (cached on the ProblemData instance)"""
+        if data._books_by_kit is None:
+            book_map = DataLoader.get_book_map(data)
+            data._books_by_kit = {
+                kit.id: [book_map[book_id] for book_id in kit.book_ids]
+                for kit in data.kits
+            }
+        return data._books_by_kit
 
     @staticmethod
     def get_cost_matrix(data: ProblemData) -> Dict[tuple[str, str, str], float]:
         """
-        Create a cost lookup dictionary
+        Create a cost lookup dictionary (cached on the ProblemData instance)
 
         Returns:
             Dict mapping (book_id, supplier_id, printing_method) -> unit_cost
         """
-        return {
-            (cost.book_id, cost.supplier_id, cost.printing_method): cost.unit_cost
-            for cost in data.costs
-        }
+        if data._cost_matrix is None:
+            data._cost_matrix = {
+                (cost.book_id, cost.supplier_id, cost.printing_method): cost.unit_cost
+                for cost in data.costs
+            }
+        return data._cost_matrix
 
     @staticmethod
     def get_books_by_brand(data: ProblemData) -> Dict[str, List[Book]]:
-        """Group books by brand"""
-        books_by_brand: Dict[str, List[Book]] = {}
-        for book in data.books:
-            if book.brand not in books_by_brand:
-                books_by_brand[book.brand] = []
-            books_by_brand[book.brand].append(book)
-        return books_by_brand
+        """Group books by brand (cached on the ProblemData instance)"""
+        if data._books_by_brand is None:
+            books_by_brand: Dict[str, List[Book]] = {}
+            for book in data.books:
+                if book.brand not in books_by_brand:
+                    books_by_brand[book.brand] = []
+                books_by_brand[book.brand].append(book)
+            data._books_by_brand = books_by_brand
+        return data._books_by_brand
@@ -1,11 +1,22 @@
 """Result export and reporting utilities"""
 
-import csv
 from pathlib import Path
-from typing import List, Dict
+from typing import List
 
+import numpy as np
+import pandas as pd
+
+from .data_loader import DataLoader
 from .models import OptimizationResult, Assignment, ProblemData
 
+# Options shared by every CSV export: money columns are formatted by the C
+# writer in a single pass, and lines end in CRLF as with the csv module
+CSV_OPTIONS = {
+    'float_format': '%.2f',
+    'encoding': 'utf-8',
+    'lineterminator': '\r\n'
+}
+
 
 class ResultExporter:
     """Export optimization results in various formats"""
@@ -26,12 +37,22 @@ class ResultExporter:
         """
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create book and supplier maps for enrichment
-        book_map = {book.id: book for book in data.books}
-        supplier_map = {supplier.id: supplier for supplier in data.suppliers}
+        book_map = DataLoader.get_book_map(data)
+        supplier_map = DataLoader.get_supplier_map(data)
+
+        df = ResultExporter._assignments_frame(assignments)
+        df.sort_values(['supplier_id', 'book_id'], inplace=True, kind='stable')
 
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=[
+        # Enrich with book and supplier attributes
+        books = df['book_id'].map(book_map)
+        df['book_title'] = [book.title for book in books]
+        df['brand'] = [book.brand for book in books]
+        df['kit_id'] = [book.kit_id or '' for book in books]
+        df['supplier_name'] = [supplier_map[supplier_id].name for supplier_id in df['supplier_id']]
+
+        df.to_csv(
+            output_file,
+            columns=[
                 'book_id',
                 'book_title',
                 'brand',
@@ -42,25 +63,10 @@ class ResultExporter:
                 'printing_method',
                 'unit_cost',
                 'total_cost'
-            ])
-            writer.writeheader()
-
-            for assignment in sorted(assignments, key=lambda a: (a.supplier_id, a.book_id)):
-                book = book_map[assignment.book_id]
-                supplier = supplier_map[assignment.supplier_id]
-
-                writer.writerow({
-                    'book_id': assignment.book_id,
-                    'book_title': book.title,
-                    'brand': book.brand,
-                    'kit_id': book.kit_id or '',
-                    'supplier_id': assignment.supplier_id,
-                    'supplier_name': supplier.name,
-                    'production_volume': assignment.production_volume,
-                    'printing_method': assignment.printing_method,
-                    'unit_cost': f"{assignment.unit_cost:.2f}",
-                    'total_cost': f"{assignment.total_cost:.2f}"
-                })
+            ],
+            index=False,
+            **CSV_OPTIONS
+        )
 
     @staticmethod
     def export_supplier_summary_csv(
@@ -78,48 +84,27 @@ class ResultExporter:
         """
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        supplier_map = {supplier.id: supplier for supplier in data.suppliers}
-
-        # Aggregate by supplier
-        supplier_stats: Dict[str, Dict] = {}
-
-        for assignment in result.assignments:
-            supplier_id = assignment.supplier_id
+        supplier_map = DataLoader.get_supplier_map(data)
 
-            if supplier_id not in supplier_stats:
-                supplier_stats[supplier_id] = {
-                    'supplier_name': supplier_map[supplier_id].name,
-                    'book_count': 0,
-                    'total_volume': 0,
-                    'total_cost': 0.0
-                }
-
-            supplier_stats[supplier_id]['book_count'] += 1
-            supplier_stats[supplier_id]['total_volume'] += assignment.production_volume
-            supplier_stats[supplier_id]['total_cost'] += assignment.total_cost
-
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=[
-                'supplier_id',
-                'supplier_name',
-                'books_assigned',
-                'total_volume',
-                'total_cost',
-                'avg_cost_per_unit'
-            ])
-            writer.writeheader()
-
-            for supplier_id, stats in sorted(supplier_stats.items()):
-                avg_cost = stats['total_cost'] / stats['total_volume'] if stats['total_volume'] > 0 else 0
-
-                writer.writerow({
-                    'supplier_id': supplier_id,
-                    'supplier_name': stats['supplier_name'],
-                    'books_assigned': stats['book_count'],
-                    'total_volume': stats['total_volume'],
-                    'total_cost': f"{stats['total_cost']:.2f}",
-                    'avg_cost_per_unit': f"{avg_cost:.2f}"
-                })
+        summary = (
+            ResultExporter._assignments_frame(result.assignments)
+            .groupby('supplier_id', sort=True)
+            .agg(
+                books_assigned=('book_id', 'count'),
+                total_volume=('production_volume', 'sum'),
+                total_cost=('total_cost', 'sum')
+            )
+        )
+        summary.insert(
+            0,
+            'supplier_name',
+            [supplier_map[supplier_id].name for supplier_id in summary.index]
+        )
+        summary['avg_cost_per_unit'] = (
+            summary['total_cost'] / summary['total_volume'].where(summary['total_volume'] > 0)
+        ).fillna(0.0)
+
+        summary.to_csv(output_file, **CSV_OPTIONS)
 
     @staticmethod
     def export_brand_distribution_csv(
@@ -137,44 +122,53 @@ class ResultExporter:
         """
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        book_map = {book.id: book for book in data.books}
-        supplier_map = {supplier.id: supplier for supplier in data.suppliers}
+        book_map = DataLoader.get_book_map(data)
+        all_supplier_ids = pd.Index(sorted({s.id for s in data.suppliers}))
+
+        # Integer codes for the brand rows (sorted) and supplier columns
+        brand_idx, brands = pd.factorize(
+            np.array(
+                [book_map[a.book_id].brand for a in result.assignments], dtype=object
+            ),
+            sort=True
+        )
+        supplier_idx = all_supplier_ids.get_indexer(
+            [a.supplier_id for a in result.assignments]
+        )
+        known = supplier_idx >= 0
+        brand_idx, supplier_idx = brand_idx[known], supplier_idx[known]
+        present_brands = np.unique(brand_idx)
+
+        # Dense brand x supplier count matrix from a single bincount
+        num_suppliers = len(all_supplier_ids)
+        counts = np.bincount(
+            brand_idx * num_suppliers + supplier_idx,
+            minlength=len(brands) * num_suppliers
+        ).reshape(len(brands), num_suppliers)[present_brands]
+
+        # Leave cells empty where a brand has no books at the supplier
+        distribution = pd.DataFrame(
+            np.where(counts > 0, counts.astype(object), ''),
+            index=pd.Index(brands[present_brands], name='brand'),
+            columns=all_supplier_ids
+        )
+        distribution['total'] = counts.sum(axis=1)
+
+        distribution.to_csv(output_file, **CSV_OPTIONS)
 
-        # Track brand distribution: brand -> supplier -> count
-        distribution: Dict[str, Dict[str, int]] = {}
-
-        for assignment in result.assignments:
-            book = book_map[assignment.book_id]
-            brand = book.brand
-            supplier_id = assignment.supplier_id
-
-            if brand not in distribution:
-                distribution[brand] = {}
-
-            if supplier_id not in distribution[brand]:
-                distribution[brand][supplier_id] = 0
-
-            distribution[brand][supplier_id] += 1
-
-        # Get all supplier IDs for columns
-        all_supplier_ids = sorted({s.id for s in data.suppliers})
-        fieldnames = ['brand'] + all_supplier_ids + ['total']
-
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for brand in sorted(distribution.keys()):
-                row = {'brand': brand}
-                total = 0
-
-                for supplier_id in all_supplier_ids:
-                    count = distribution[brand].get(supplier_id, 0)
-                    row[supplier_id] = count if count > 0 else ''
-                    total += count
-
-                row['total'] = total
-                writer.writerow(row)
+    @staticmethod
+    def _assignments_frame(assignments: List[Assignment]) -> pd.DataFrame:
+        """Build a column-wise DataFrame of the assignments"""
+        return pd.DataFrame({
+            'book_id': pd.Series([a.book_id for a in assignments], dtype=object),
+            'supplier_id': pd.Series([a.supplier_id for a in assignments], dtype=object),
+            'printing_method': pd.Series([a.printing_method for a in assignments], dtype=object),
+            'production_volume': np.array(
+                [a.production_volume for a in assignments], dtype=np.int64
+            ),
+            'unit_cost': np.array([a.unit_cost for a in assignments], dtype=np.float64),
+            'total_cost': np.array([a.total_cost for a in assignments], dtype=np.float64)
+        })
 
     @staticmethod
     def generate_report(
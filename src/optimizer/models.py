@@ -1,12 +1,15 @@
 """Data models for the optimization problem"""
 
-from typing import Dict, List, Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 
 class Book(BaseModel):
     """Represents a book to be printed"""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique book identifier")
     title: str = Field(..., description="Book title")
     brand: str = Field(..., description="Brand/series the book belongs to")
@@ -31,6 +34,8 @@ class Book(BaseModel):
 class Kit(BaseModel):
     """Represents a kit (bundle of books that must be allocated together)"""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique kit identifier")
     name: str = Field(..., description="Kit name")
     book_ids: List[str] = Field(..., min_length=1, description="Books in this kit")
@@ -47,6 +52,8 @@ class Kit(BaseModel):
 class Supplier(BaseModel):
     """Represents a printing supplier"""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique supplier identifier")
     name: str = Field(..., description="Supplier name")
     capacities: Dict[str, int] = Field(
@@ -69,6 +76,8 @@ class Supplier(BaseModel):
 class Cost(BaseModel):
     """Represents the cost of printing a book at a supplier using a specific method"""
 
+    model_config = ConfigDict(frozen=True)
+
     book_id: str = Field(..., description="Book identifier")
     supplier_id: str = Field(..., description="Supplier identifier")
     printing_method: str = Field(..., description="Printing method (e.g., offset, digital)")
@@ -84,6 +93,8 @@ class Cost(BaseModel):
 class OptimizationConfig(BaseModel):
     """Configuration for the optimization problem"""
 
+    model_config = ConfigDict(frozen=True)
+
     max_volumes_per_brand_per_supplier: int = Field(
         4,
         gt=0,
@@ -104,10 +115,72 @@ class OptimizationConfig(BaseModel):
         True,
         description="Enable symmetry breaking constraints"
     )
+    enable_warm_start_hint: bool = Field(
+        False,
+        description="Seed the search with a greedy assignment hint"
+    )
+    enable_dominance_pruning: bool = Field(
+        False,
+        description="Skip (supplier, method) options far more expensive than a book's cheapest "
+                    "option (heuristic: may exclude the true optimum, and in rare cases make a "
+                    "feasible instance infeasible)"
+    )
+    dominance_factor: float = Field(
+        1.5,
+        gt=1.0,
+        description="Options costing more than this factor times the cheapest are pruned, "
+                    "unless their brand would exceed its cap or their printing method's "
+                    "capacity at the kept suppliers is scarce"
+    )
+    canonical_ordering: bool = Field(
+        False,
+        description="Create variables for books by decreasing volume and suppliers by "
+                    "decreasing total capacity (changes CP-SAT's variable order)"
+    )
+    enable_lp_fast_path: bool = Field(
+        False,
+        description="Solve instances without multi-book kits or binding brand caps as an LP, "
+                    "falling back to CP-SAT when the LP solution is fractional"
+    )
+    debug_var_names: bool = Field(
+        False,
+        description="Give CP-SAT variables descriptive names (larger model, for debugging)"
+    )
+    log_search_progress: bool = Field(
+        True,
+        description="Print the CP-SAT search log (disable for benchmark runs)"
+    )
+    linearization_level: int = Field(
+        1,
+        ge=0,
+        le=2,
+        description="CP-SAT linearization level (2 adds the full LP relaxation)"
+    )
+    symmetry_level: int = Field(
+        2,
+        ge=0,
+        le=4,
+        description="CP-SAT symmetry detection level"
+    )
+    cp_model_probing_level: int = Field(
+        2,
+        ge=0,
+        description="CP-SAT presolve probing level"
+    )
+    interleave_search: bool = Field(
+        False,
+        description="Interleave CP-SAT subsolvers in a single deterministic search"
+    )
 
 
 class ProblemData(BaseModel):
-    """Complete problem data"""
+    """Complete problem data
+
+    Frozen so that the lookup tables cached by DataLoader stay in sync
+    with the fields they were built from.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     books: List[Book]
     kits: List[Kit]
@@ -115,6 +188,13 @@ class ProblemData(BaseModel):
     costs: List[Cost]
     config: OptimizationConfig = Field(default_factory=OptimizationConfig)
 
+    # Lookup caches populated lazily by DataLoader.get_*
+    _book_map: Optional[Dict[str, Book]] = PrivateAttr(default=None)
+    _supplier_map: Optional[Dict[str, Supplier]] = PrivateAttr(default=None)
+    _cost_matrix: Optional[Dict[Tuple[str, str, str], float]] = PrivateAttr(default=None)
+    _books_by_kit: Optional[Dict[str, List[Book]]] = PrivateAttr(default=None)
+    _books_by_brand: Optional[Dict[str, List[Book]]] = PrivateAttr(default=None)
+
     @field_validator('books')
     @classmethod
     def validate_unique_books(cls, v: List[Book]) -> List[Book]:
@@ -146,6 +226,8 @@ class ProblemData(BaseModel):
 class Assignment(BaseModel):
     """Represents an assignment of a book to a supplier using a specific printing method"""
 
+    model_config = ConfigDict(frozen=True)
+
     book_id: str
     supplier_id: str
     printing_method: str
@@ -1,12 +1,20 @@
 """CP-SAT solver for the supplier allocation problem with printing method optimization"""
 
 import time
-from collections import defaultdict
-from typing import Dict, List, Set, Tuple
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Set, Tuple
 
+import numpy as np
+from ortools.linear_solver import pywraplp
 from ortools.sat.python import cp_model
 
-from .models import Book, ProblemData, OptimizationResult, Assignment
+from .models import Book, Supplier, ProblemData, OptimizationResult, Assignment
+
+# Variable key: (book_id, supplier_id, printing_method)
+VarKey = Tuple[str, str, str]
+
+# Assignment variables and their production volumes, for WeightedSum
+VolumeTerms = Tuple[List[cp_model.IntVar], List[int]]
 
 
 class SupplierAllocationSolver:
@@ -46,6 +54,196 @@ class SupplierAllocationSolver:
         for book in data.books:
             self.books_by_brand[book.brand].append(book.id)
 
+        # Iteration order used for every model builder (and thus for CP-SAT's
+        # variable and constraint order)
+        self._books: List[Book] = list(data.books)
+        self._suppliers: List[Supplier] = list(data.suppliers)
+        if data.config.canonical_ordering:
+            self._books.sort(key=lambda book: (-book.production_volume, book.id))
+            self._suppliers.sort(
+                key=lambda supplier: (-sum(supplier.capacities.values()), supplier.id)
+            )
+
+        # Every (book, supplier, method) combination with a cost, found in one
+        # pass so the model builders never rescan books x suppliers
+        self._valid_triples: List[Tuple[Book, Supplier, str, float]] = []
+        self._triples_by_book: Dict[str, List[VarKey]] = defaultdict(list)
+
+        # Model attributes read in the hot loops, bound once to plain dicts/locals
+        self._volume_by_book: Dict[str, int] = {
+            book.id: book.production_volume for book in data.books
+        }
+        cost_matrix = self.cost_matrix
+        suppliers = [(supplier, supplier.id) for supplier in self._suppliers]
+
+        # All costed (supplier, method) options of each book
+        options_by_book: Dict[str, List[Tuple[Supplier, str, str, float]]] = {}
+        for book in self._books:
+            book_id = book.id
+            methods = book.available_printing_methods
+            options = options_by_book[book_id] = []
+            for supplier, supplier_id in suppliers:
+                for method in methods:
+                    unit_cost = cost_matrix.get((book_id, supplier_id, method))
+                    if unit_cost is not None:
+                        options.append((supplier, supplier_id, method, unit_cost))
+        self.num_pruned_options = 0
+        unpruned_options = None
+        if data.config.enable_dominance_pruning:
+            # Pruning replaces each book's list, so a shallow copy keeps the originals
+            unpruned_options = dict(options_by_book)
+            self._prune_dominated_options(options_by_book)
+
+        for book in self._books:
+            book_id = book.id
+            by_book = self._triples_by_book[book_id]
+            for supplier, supplier_id, method, unit_cost in options_by_book[book_id]:
+                self._valid_triples.append((book, supplier, method, unit_cost))
+                by_book.append((book_id, supplier_id, method))
+
+        # Objective coefficients (total cost in thousandths) aligned with the triples,
+        # rounded to the nearest integer in one vectorized pass
+        num_triples = len(self._valid_triples)
+        unit_costs = np.fromiter(
+            (triple[3] for triple in self._valid_triples), dtype=np.float64, count=num_triples
+        )
+        volume_by_book = self._volume_by_book
+        volumes = np.fromiter(
+            (volume_by_book[triple[0].id] for triple in self._valid_triples),
+            dtype=np.int64,
+            count=num_triples
+        )
+        self._scaled_costs: np.ndarray = np.rint(unit_costs * volumes * 1000).astype(np.int64)
+
+        # Dense unit cost array indexed [book, method, supplier], NaN where no cost exists
+        self._supplier_idx: Dict[str, int] = {
+            supplier_id: i for i, (_, supplier_id) in enumerate(suppliers)
+        }
+        self._book_idx: Dict[str, int] = {book.id: i for i, book in enumerate(self._books)}
+        method_idx: Dict[str, int] = {}
+        for book in self._books:
+            for method in book.available_printing_methods:
+                method_idx.setdefault(method, len(method_idx))
+        self._methods: List[str] = list(method_idx)
+
+        self._cost_array = np.full(
+            (len(self._book_idx), len(method_idx), len(self._supplier_idx)), np.nan
+        )
+        self._cost_array[
+            [self._book_idx[triple[0].id] for triple in self._valid_triples],
+            [method_idx[triple[2]] for triple in self._valid_triples],
+            [self._supplier_idx[triple[1].id] for triple in self._valid_triples]
+        ] = unit_costs
+
+        # Symmetry breaking compares suppliers on every costed option, pruned or not:
+        # suppliers that differ only in a pruned option are not interchangeable
+        self._unpruned_cost_array = self._cost_array
+        if unpruned_options is not None:
+            entries = [
+                (book_id, option)
+                for book_id, options in unpruned_options.items()
+                for option in options
+            ]
+            self._unpruned_cost_array = np.full(self._cost_array.shape, np.nan)
+            self._unpruned_cost_array[
+                [self._book_idx[book_id] for book_id, _ in entries],
+                [method_idx[option[2]] for _, option in entries],
+                [self._supplier_idx[option[1]] for _, option in entries]
+            ] = [option[3] for _, option in entries]
+
+    def _prune_dominated_options(
+        self, options_by_book: Dict[str, List[Tuple[Supplier, str, str, float]]]
+    ) -> None:
+        """
+        Drop (supplier, method) options that are unlikely to be optimal (in place)
+
+        A book keeps the suppliers whose cheapest option costs at most
+        dominance_factor times its overall cheapest option. Kit books keep the
+        union of their kit's suppliers, so cohesion never loses a supplier that
+        one of the books needs. Books of a brand with more items than the brand
+        cap allows across its kept suppliers keep every option, and so do
+        options using a printing method that is scarce at the kept suppliers.
+        """
+        factor = self.data.config.dominance_factor
+        max_kits = self.data.config.max_volumes_per_brand_per_supplier
+
+        kept_suppliers: Dict[str, Set[str]] = {}
+        for book_id, options in options_by_book.items():
+            if options:
+                max_cost = min(option[3] for option in options) * factor
+                kept_suppliers[book_id] = {
+                    option[1] for option in options if option[3] <= max_cost
+                }
+            else:
+                kept_suppliers[book_id] = set()
+
+        for kit in self.data.kits:
+            kit_suppliers = set().union(*(kept_suppliers[book_id] for book_id in kit.book_ids))
+            for book_id in kit.book_ids:
+                kept_suppliers[book_id] = kit_suppliers
+
+        # Items (kits and standalone books) counted against each brand's cap, keyed by
+        # their representative book as in _add_brand_diversification_constraints
+        for brand, book_ids in self.books_by_brand.items():
+            item_books: Dict[str, List[str]] = {}
+            for book_id in book_ids:
+                kit_id = self.book_map[book_id].kit_id
+                if kit_id:
+                    kit_book_ids = self.kit_map[kit_id].book_ids
+                    item_books[kit_book_ids[0]] = kit_book_ids
+                else:
+                    item_books[book_id] = [book_id]
+
+            brand_books = [book_id for books in item_books.values() for book_id in books]
+            brand_suppliers = set().union(*(kept_suppliers[book_id] for book_id in brand_books))
+            if len(item_books) > max_kits * len(brand_suppliers):
+                for book_id in brand_books:
+                    kept_suppliers[book_id] = {option[1] for option in options_by_book[book_id]}
+
+        kept_options = {
+            book_id: [option for option in options if option[1] in kept_suppliers[book_id]]
+            for book_id, options in options_by_book.items()
+        }
+        scarce_methods = self._scarce_methods(kept_options, factor)
+
+        for book_id, options in options_by_book.items():
+            kept = [
+                option for option in options
+                if option[1] in kept_suppliers[book_id] or option[2] in scarce_methods
+            ]
+            self.num_pruned_options += len(options) - len(kept)
+            options_by_book[book_id] = kept
+
+    def _scarce_methods(
+        self, kept_options: Dict[str, List[Tuple[Supplier, str, str, float]]], factor: float
+    ) -> Set[str]:
+        """
+        Printing methods whose total capacity at the kept suppliers is less than
+        factor times the volume of all books that can use them (suppliers without
+        a capacity for a method are unbounded for it)
+        """
+        demand: Dict[str, int] = defaultdict(int)
+        for book in self.data.books:
+            for method in book.available_printing_methods:
+                demand[method] += book.production_volume
+
+        # method -> supplier_id -> supplier, for suppliers with a kept option using it
+        kept_suppliers: Dict[str, Dict[str, Supplier]] = defaultdict(dict)
+        for options in kept_options.values():
+            for supplier, supplier_id, method, _ in options:
+                kept_suppliers[method][supplier_id] = supplier
+
+        scarce = set()
+        for method, volume in demand.items():
+            capacities = [
+                supplier.capacities.get(method) for supplier in kept_suppliers[method].values()
+            ]
+            if None in capacities:
+                continue
+            if sum(capacities) < volume * factor:
+                scarce.add(method)
+        return scarce
+
     def build_model(self) -> None:
         """Build the complete CP-SAT model with all constraints"""
         self._create_variables()
@@ -58,26 +256,61 @@ class SupplierAllocationSolver:
         if self.data.config.enable_symmetry_breaking:
             self._add_symmetry_breaking_constraints()
 
+        if self.data.config.enable_warm_start_hint:
+            self._add_greedy_hint()
+
     def _create_variables(self) -> None:
-        """Create decision variables for book-to-supplier-method assignments"""
-        for book in self.data.books:
-            for supplier in self.data.suppliers:
-                for method in book.available_printing_methods:
-                    # Only create variable if there's a cost defined for this combination
-                    if (book.id, supplier.id, method) in self.cost_matrix:
-                        var_name = f"x_{book.id}_{supplier.id}_{method}"
-                        self.x[book.id, supplier.id, method] = self.model.NewBoolVar(var_name)
+        """
+        Create decision variables for book-to-supplier-method assignments
+
+        Variables are grouped for the constraint builders in the same pass, so the
+        triples are walked once and the builders never look variables up by key.
+        """
+        # Only combinations with a cost defined get a variable; variables (and their
+        # model indices) are kept aligned with self._valid_triples
+        self._triple_vars: List[cp_model.IntVar] = []
+        self._vars_by_book: Dict[str, List[cp_model.IntVar]] = defaultdict(list)
+        # book_id -> supplier_id -> variables (one per available method), so the
+        # builders fetch a book's suppliers once instead of hashing (book, supplier)
+        self._vars_by_book_supplier: Dict[str, Dict[str, List[cp_model.IntVar]]] = (
+            defaultdict(lambda: defaultdict(list))
+        )
+        # (variables, production volumes) per supplier and per (supplier, method)
+        self._volume_terms_by_supplier: Dict[str, VolumeTerms] = defaultdict(lambda: ([], []))
+        self._volume_terms_by_supplier_method: Dict[Tuple[str, str], VolumeTerms] = (
+            defaultdict(lambda: ([], []))
+        )
+
+        # Variables are unnamed unless debugging: names only grow the model proto
+        new_bool_var = self.model.NewBoolVar
+        debug_var_names = self.data.config.debug_var_names
+        for book, supplier, method, _ in self._valid_triples:
+            book_id = book.id
+            supplier_id = supplier.id
+            volume = book.production_volume
+            var = new_bool_var(f"x_{book_id}_{supplier_id}_{method}" if debug_var_names else "")
+            self.x[book_id, supplier_id, method] = var
+            self._triple_vars.append(var)
+            self._vars_by_book[book_id].append(var)
+            self._vars_by_book_supplier[book_id][supplier_id].append(var)
+            supplier_vars, supplier_volumes = self._volume_terms_by_supplier[supplier_id]
+            supplier_vars.append(var)
+            supplier_volumes.append(volume)
+            method_vars, method_volumes = self._volume_terms_by_supplier_method[supplier_id, method]
+            method_vars.append(var)
+            method_volumes.append(volume)
+
+        self._triple_var_indices = np.fromiter(
+            (var.Index() for var in self._triple_vars),
+            dtype=np.int64,
+            count=len(self._triple_vars)
+        )
 
     def _add_assignment_constraints(self) -> None:
         """Each book must be assigned to exactly one (supplier, method) combination"""
-        for book in self.data.books:
+        for book in self._books:
             # Get all valid (supplier, method) combinations for this book
-            valid_assignments = [
-                self.x[book.id, supplier.id, method]
-                for supplier in self.data.suppliers
-                for method in book.available_printing_methods
-                if (book.id, supplier.id, method) in self.x
-            ]
+            valid_assignments = self._vars_by_book.get(book.id)
 
             if not valid_assignments:
                 raise ValueError(
@@ -85,7 +318,7 @@ class SupplierAllocationSolver:
                 )
 
             # Exactly one (supplier, method) pair per book
-            self.model.Add(sum(valid_assignments) == 1)
+            self.model.Add(cp_model.LinearExpr.Sum(valid_assignments) == 1)
 
     def _add_kit_cohesion_constraints(self) -> None:
         """All books in a kit must be assigned to the same supplier (but can use different methods)"""
@@ -94,132 +327,83 @@ class SupplierAllocationSolver:
                 continue  # Single-book kits don't need cohesion constraints
 
             # Reference book (first book in kit)
-            ref_book_id = kit.book_ids[0]
-
-            # For each supplier, create a variable indicating if the kit is assigned to that supplier
-            kit_supplier_vars = {}
-            for supplier in self.data.suppliers:
-                kit_supplier_vars[supplier.id] = self.model.NewBoolVar(
-                    f"kit_{kit.id}_supplier_{supplier.id}"
-                )
-
-                # Kit is assigned to supplier if ref_book is assigned to supplier (any method)
-                ref_book_to_supplier = [
-                    self.x[ref_book_id, supplier.id, method]
-                    for method in self.book_map[ref_book_id].available_printing_methods
-                    if (ref_book_id, supplier.id, method) in self.x
-                ]
-
-                if ref_book_to_supplier:
-                    # kit_supplier_var == 1 iff any method of ref_book is assigned to this supplier
-                    self.model.Add(
-                        sum(ref_book_to_supplier) == kit_supplier_vars[supplier.id]
-                    )
-
-            # All other books must be assigned to the same supplier as the reference book
-            for book_id in kit.book_ids[1:]:
-                for supplier in self.data.suppliers:
-                    # If kit is assigned to this supplier, this book must also be assigned to this supplier
-                    book_to_supplier = [
-                        self.x[book_id, supplier.id, method]
-                        for method in self.book_map[book_id].available_printing_methods
-                        if (book_id, supplier.id, method) in self.x
-                    ]
-
-                    if book_to_supplier and supplier.id in kit_supplier_vars:
-                        # sum(book_to_supplier) == kit_supplier_var[supplier]
+            ref_book_vars = self._supplier_vars(kit.book_ids[0])
+            other_book_vars = [self._supplier_vars(book_id) for book_id in kit.book_ids[1:]]
+
+            for supplier in self._suppliers:
+                # Reference book is assigned to supplier (any method)
+                ref_book_to_supplier = ref_book_vars.get(supplier.id, [])
+
+                # Every other book is at this supplier exactly when the reference book is
+                for book_vars in other_book_vars:
+                    book_to_supplier = book_vars.get(supplier.id, [])
+
+                    if len(book_to_supplier) == 1 and len(ref_book_to_supplier) == 1:
+                        # Single literals on both sides: a pair of SAT implications
+                        self.model.AddImplication(book_to_supplier[0], ref_book_to_supplier[0])
+                        self.model.AddImplication(ref_book_to_supplier[0], book_to_supplier[0])
+                    elif ref_book_to_supplier or book_to_supplier:
                         self.model.Add(
-                            sum(book_to_supplier) == kit_supplier_vars[supplier.id]
+                            cp_model.LinearExpr.Sum(book_to_supplier)
+                            == cp_model.LinearExpr.Sum(ref_book_to_supplier)
                         )
 
+    def _supplier_vars(self, book_id: str) -> Dict[str, List[cp_model.IntVar]]:
+        """Assignment variables of a book by supplier (one per available method)"""
+        return self._vars_by_book_supplier.get(book_id, {})
+
     def _add_brand_diversification_constraints(self) -> None:
         """
         Maximum kits per brand per supplier constraint
 
         Counts distinct kits (not individual books). A kit with 3 books counts as 1.
         Standalone books (not in kits) each count as 1.
+
+        The assignment variables of one book at one supplier already sum to 0 or 1
+        (exactly-one assignment), so they are summed directly instead of through
+        per-item indicator variables.
         """
         max_kits = self.data.config.max_volumes_per_brand_per_supplier
 
         for brand, book_ids in self.books_by_brand.items():
-            for supplier in self.data.suppliers:
-                # Find all kits that contain at least one book from this brand
-                kits_with_brand = set()
-                standalone_books = []
-
-                for book_id in book_ids:
-                    book = self.book_map[book_id]
-                    if book.kit_id:
-                        kits_with_brand.add(book.kit_id)
-                    else:
-                        standalone_books.append(book_id)
-
-                items_to_count = []  # Both kits and standalone books
-
-                # Create indicators for each kit (counts as 1 regardless of number of books)
-                for kit_id in kits_with_brand:
-                    kit_to_supplier = self.model.NewBoolVar(
-                        f"brand_{brand}_kit_{kit_id}_supplier_{supplier.id}"
-                    )
-
-                    # Kit is assigned to supplier if ANY book in the kit is assigned to supplier
-                    # (all books in kit go to same supplier due to kit cohesion constraint)
-                    kit = self.kit_map[kit_id]
-                    # Pick the first book in the kit as representative
-                    first_book_id = kit.book_ids[0]
-                    first_book_methods = [
-                        self.x[first_book_id, supplier.id, method]
-                        for method in self.book_map[first_book_id].available_printing_methods
-                        if (first_book_id, supplier.id, method) in self.x
-                    ]
-
-                    if first_book_methods:
-                        self.model.Add(sum(first_book_methods) == kit_to_supplier)
-                        items_to_count.append(kit_to_supplier)
-
-                # Create indicators for standalone books (each counts as 1 "kit")
-                for book_id in standalone_books:
-                    book = self.book_map[book_id]
-                    book_to_supplier = self.model.NewBoolVar(
-                        f"brand_{brand}_book_{book_id}_supplier_{supplier.id}"
-                    )
-
-                    methods_for_book = [
-                        self.x[book_id, supplier.id, method]
-                        for method in book.available_printing_methods
-                        if (book_id, supplier.id, method) in self.x
-                    ]
-
-                    if methods_for_book:
-                        self.model.Add(sum(methods_for_book) == book_to_supplier)
-                        items_to_count.append(book_to_supplier)
+            # Kits that contain at least one book from this brand, and standalone books.
+            # A kit is represented by its first book (kit cohesion keeps the rest with it).
+            representative_books: Dict[str, None] = {}
+            for book_id in book_ids:
+                kit_id = self.book_map[book_id].kit_id
+                if kit_id:
+                    representative_books[self.kit_map[kit_id].book_ids[0]] = None
+                else:
+                    representative_books[book_id] = None
+
+            representative_vars = [self._supplier_vars(book_id) for book_id in representative_books]
+
+            for supplier in self._suppliers:
+                supplier_id = supplier.id
+                items_to_count = [
+                    var
+                    for book_vars in representative_vars
+                    for var in book_vars.get(supplier_id, ())
+                ]
 
                 # Total kits + standalone books <= max_kits
                 if items_to_count:
-                    self.model.Add(sum(items_to_count) <= max_kits)
+                    self.model.Add(cp_model.LinearExpr.Sum(items_to_count) <= max_kits)
 
     def _add_capacity_constraints(self) -> None:
         """Supplier capacity constraints by printing method"""
-        for supplier in self.data.suppliers:
-            # Group by printing method
-            books_by_method: Dict[str, List[Tuple[str, str, int]]] = defaultdict(list)
-
-            for book in self.data.books:
-                for method in book.available_printing_methods:
-                    if (book.id, supplier.id, method) in self.x:
-                        books_by_method[method].append(
-                            (book.id, method, book.production_volume)
-                        )
-
+        for supplier in self._suppliers:
             # Add capacity constraint for each printing method
             for method, capacity in supplier.capacities.items():
-                if method in books_by_method:
+                terms = self._volume_terms_by_supplier_method.get((supplier.id, method))
+                if terms:
                     # Sum of (production_volume * assignment_var) <= capacity
-                    total_volume_expr = sum(
-                        volume * self.x[book_id, supplier.id, book_method]
-                        for book_id, book_method, volume in books_by_method[method]
-                    )
-                    self.model.Add(total_volume_expr <= capacity)
+                    self.model.Add(self._volume_expr(terms) <= capacity)
+
+    @staticmethod
+    def _volume_expr(terms: VolumeTerms) -> cp_model.LinearExpr:
+        """Total production volume of the given assignment variables"""
+        return cp_model.LinearExpr.WeightedSum(*terms)
 
     def _add_symmetry_breaking_constraints(self) -> None:
         """
@@ -231,7 +415,7 @@ class SupplierAllocationSolver:
         # Group suppliers by their characteristics (capacities)
         supplier_groups: Dict[tuple, List[str]] = defaultdict(list)
 
-        for supplier in self.data.suppliers:
+        for supplier in self._suppliers:
             # Create a hashable signature of the supplier's capacities
             capacity_signature = tuple(sorted(supplier.capacities.items()))
             supplier_groups[capacity_signature].append(supplier.id)
@@ -241,57 +425,100 @@ class SupplierAllocationSolver:
             if len(supplier_ids) < 2:
                 continue
 
-            # Check if these suppliers also have identical costs for all (book, method) combinations
-            identical_costs = True
-            for book in self.data.books:
-                for method in book.available_printing_methods:
-                    costs = []
-                    for supplier_id in supplier_ids:
-                        if (book.id, supplier_id, method) in self.cost_matrix:
-                            costs.append(self.cost_matrix[book.id, supplier_id, method])
-
-                    if len(set(costs)) > 1:  # Costs differ
-                        identical_costs = False
-                        break
-                if not identical_costs:
-                    break
+            # Check if these suppliers also have identical costs for all (book, method)
+            # combinations: the defined costs of each (book, method) must span no range
+            group_costs = self._unpruned_cost_array[
+                :, :, [self._supplier_idx[supplier_id] for supplier_id in supplier_ids]
+            ]
+            identical_costs = not np.any(
+                np.fmax.reduce(group_costs, axis=2) > np.fmin.reduce(group_costs, axis=2)
+            )
 
             if identical_costs:
+                # Total volume assigned to each supplier, built once per supplier
+                volume_exprs = {}
+                for supplier_id in supplier_ids:
+                    terms = self._volume_terms_by_supplier.get(supplier_id)
+                    volume_exprs[supplier_id] = self._volume_expr(terms) if terms else None
+
                 # Add ordering constraint: total volume of s1 >= total volume of s2
-                for i in range(len(supplier_ids) - 1):
-                    s1_id = supplier_ids[i]
-                    s2_id = supplier_ids[i + 1]
-
-                    # Calculate total volume assigned to each supplier
-                    s1_volumes = []
-                    s2_volumes = []
-
-                    for book in self.data.books:
-                        for method in book.available_printing_methods:
-                            if (book.id, s1_id, method) in self.x:
-                                s1_volumes.append(
-                                    book.production_volume * self.x[book.id, s1_id, method]
-                                )
-                            if (book.id, s2_id, method) in self.x:
-                                s2_volumes.append(
-                                    book.production_volume * self.x[book.id, s2_id, method]
-                                )
-
-                    if s1_volumes and s2_volumes:
-                        self.model.Add(sum(s1_volumes) >= sum(s2_volumes))
+                for s1_id, s2_id in zip(supplier_ids, supplier_ids[1:]):
+                    s1_volume = volume_exprs[s1_id]
+                    s2_volume = volume_exprs[s2_id]
+
+                    if s1_volume is not None and s2_volume is not None:
+                        self.model.Add(s1_volume >= s2_volume)
 
     def _add_objective(self) -> None:
         """Minimize total printing cost"""
-        total_cost_expr = sum(
-            int(self.cost_matrix[book.id, supplier.id, method] * book.production_volume * 1000) *
-            self.x[book.id, supplier.id, method]
-            for book in self.data.books
-            for supplier in self.data.suppliers
-            for method in book.available_printing_methods
-            if (book.id, supplier.id, method) in self.x
+        self.model.Minimize(
+            cp_model.LinearExpr.WeightedSum(self._triple_vars, self._scaled_costs.tolist())
         )
 
-        self.model.Minimize(total_cost_expr)
+    def _add_greedy_hint(self) -> None:
+        """
+        Hint CP-SAT with a greedy assignment
+
+        Kits (as a block) and standalone books are placed in decreasing order of
+        volume at the supplier where they are cheapest, among the suppliers with
+        remaining method capacity and room under every affected brand cap. Units
+        that fit nowhere are left unhinted.
+        """
+        max_kits = self.data.config.max_volumes_per_brand_per_supplier
+        num_suppliers = len(self._supplier_idx)
+        supplier_range = np.arange(num_suppliers)
+
+        # Remaining capacity [supplier, method]; methods without a capacity are unbounded
+        remaining = np.full((num_suppliers, len(self._methods)), np.inf)
+        method_idx = {method: i for i, method in enumerate(self._methods)}
+        for supplier in self._suppliers:
+            for method, capacity in supplier.capacities.items():
+                if method in method_idx:
+                    remaining[self._supplier_idx[supplier.id], method_idx[method]] = capacity
+
+        # Brand items placed at each supplier [brand, supplier]
+        brand_idx = {brand: i for i, brand in enumerate(self.books_by_brand)}
+        brand_counts = np.zeros((len(brand_idx), num_suppliers), dtype=np.int64)
+
+        # Units: each kit and each standalone book
+        units = [kit.book_ids for kit in self.data.kits]
+        units.extend([book.id] for book in self.data.books if not book.kit_id)
+        units.sort(
+            key=lambda ids: sum(self._volume_by_book[book_id] for book_id in ids),
+            reverse=True
+        )
+
+        hinted: Dict[str, VarKey] = {}
+        for book_ids in units:
+            brands = list({brand_idx[self.book_map[book_id].brand] for book_id in book_ids})
+
+            # Cost of placing the unit at each supplier, choosing the cheapest method
+            # with capacity left for every book (books placed in turn)
+            unit_cost = np.where(np.all(brand_counts[brands] < max_kits, axis=0), 0.0, np.inf)
+            trial_remaining = remaining.copy()
+            chosen_methods = []
+            for book_id in book_ids:
+                volume = self._volume_by_book[book_id]
+                costs = self._cost_array[self._book_idx[book_id]].T  # [supplier, method]
+                costs = np.where((volume <= trial_remaining) & ~np.isnan(costs), costs, np.inf)
+                best_method = np.argmin(costs, axis=1)
+                unit_cost += costs[supplier_range, best_method] * volume
+                trial_remaining[supplier_range, best_method] -= volume
+                chosen_methods.append(best_method)
+
+            supplier = int(np.argmin(unit_cost))
+            if not np.isfinite(unit_cost[supplier]):
+                continue
+
+            remaining[supplier] = trial_remaining[supplier]
+            brand_counts[brands, supplier] += 1
+            supplier_id = self._suppliers[supplier].id
+            for book_id, best_method in zip(book_ids, chosen_methods):
+                hinted[book_id] = (book_id, supplier_id, self._methods[best_method[supplier]])
+
+        for book_id, chosen in hinted.items():
+            for key in self._triples_by_book.get(book_id, ()):
+                self.model.AddHint(self.x[key], key == chosen)
 
     def solve(self) -> OptimizationResult:
         """
@@ -303,9 +530,14 @@ class SupplierAllocationSolver:
         solver = cp_model.CpSolver()
 
         # Configure solver parameters
-        solver.parameters.max_time_in_seconds = self.data.config.solver_time_limit_seconds
-        solver.parameters.num_search_workers = self.data.config.num_search_workers
-        solver.parameters.log_search_progress = True
+        config = self.data.config
+        solver.parameters.max_time_in_seconds = config.solver_time_limit_seconds
+        solver.parameters.num_search_workers = config.num_search_workers
+        solver.parameters.log_search_progress = config.log_search_progress
+        solver.parameters.linearization_level = config.linearization_level
+        solver.parameters.symmetry_level = config.symmetry_level
+        solver.parameters.cp_model_probing_level = config.cp_model_probing_level
+        solver.parameters.interleave_search = config.interleave_search
 
         # Solve
         start_time = time.time()
@@ -343,27 +575,112 @@ class SupplierAllocationSolver:
                 supplier_utilization={}
             )
 
+    def solve_fast(self) -> Optional[OptimizationResult]:
+        """
+        Solve the problem as a linear program when that is exact
+
+        Without multi-book kits, and with no brand having more items than the
+        per-supplier cap, only the assignment and capacity constraints remain.
+        The LP relaxation of that problem is often integral, and then GLOP's
+        solution is optimal for the original problem.
+
+        Returns:
+            OptimizationResult, or None if the instance needs CP-SAT (call
+            build_model() and solve() instead)
+        """
+        if not self._is_pure_lp():
+            return None
+
+        lp = pywraplp.Solver.CreateSolver('GLOP')
+        lp_vars = [lp.NumVar(0.0, 1.0, '') for _ in self._valid_triples]
+        objective = lp.Objective()
+        objective.SetMinimization()
+
+        assignment_rows: Dict[str, pywraplp.Constraint] = {}
+        capacity_rows: Dict[Tuple[str, str], pywraplp.Constraint] = {}
+        for var, (book, supplier, method, _), scaled_cost in zip(
+            lp_vars, self._valid_triples, self._scaled_costs.tolist()
+        ):
+            objective.SetCoefficient(var, scaled_cost)
+
+            row = assignment_rows.get(book.id)
+            if row is None:
+                row = assignment_rows[book.id] = lp.Constraint(1.0, 1.0)
+            row.SetCoefficient(var, 1.0)
+
+            capacity = supplier.capacities.get(method)
+            if capacity is not None:
+                row = capacity_rows.get((supplier.id, method))
+                if row is None:
+                    row = capacity_rows[supplier.id, method] = lp.Constraint(0.0, capacity)
+                row.SetCoefficient(var, book.production_volume)
+
+        if len(assignment_rows) < len(self._books):
+            return None  # Some book has no option; let the CP-SAT path report it
+
+        start_time = time.time()
+        status = lp.Solve()
+        solve_time = time.time() - start_time
+        if status != pywraplp.Solver.OPTIMAL:
+            return None
+
+        values = np.fromiter(
+            (var.solution_value() for var in lp_vars), dtype=np.float64, count=len(lp_vars)
+        )
+        if np.any(np.minimum(values, 1.0 - values) > 1e-6):
+            return None  # Fractional vertex
+
+        chosen = np.flatnonzero(values > 0.5)
+        assignments = self._build_assignments(chosen)
+        return OptimizationResult(
+            status='OPTIMAL',
+            objective_value=int(self._scaled_costs[chosen].sum()) / 1000.0,
+            solve_time_seconds=solve_time,
+            assignments=assignments,
+            total_books=len(assignments),
+            total_volume=sum(a.production_volume for a in assignments),
+            supplier_utilization=self._calculate_utilization(assignments)
+        )
+
+    def _is_pure_lp(self) -> bool:
+        """Whether kit cohesion and brand diversification constrain nothing"""
+        if any(len(kit.book_ids) > 1 for kit in self.data.kits):
+            return False
+
+        # Every book is its own brand item, so a brand can never exceed the cap
+        # at one supplier if it has no more books than the cap
+        max_kits = self.data.config.max_volumes_per_brand_per_supplier
+        return all(len(book_ids) <= max_kits for book_ids in self.books_by_brand.values())
+
     def _extract_assignments(self, solver: cp_model.CpSolver) -> List[Assignment]:
         """Extract book-to-supplier-method assignments from solved model"""
+        # Read every assignment variable from the solution vector at once
+        solution = np.asarray(solver.response_proto.solution)
+        return self._build_assignments(np.flatnonzero(solution[self._triple_var_indices]))
+
+    def _build_assignments(self, chosen: np.ndarray) -> List[Assignment]:
+        """Assignments for the chosen indices into self._valid_triples"""
+        # The triples are in iteration order, so the chosen ones come out in that order
+        if self.data.config.canonical_ordering:
+            # Report assignments in input book order regardless of model order
+            book_position = {book.id: i for i, book in enumerate(self.data.books)}
+            chosen = chosen[np.argsort(
+                [book_position[self._valid_triples[i][0].id] for i in chosen.tolist()],
+                kind='stable'
+            )]
+
+        # Fields come from already validated models, so validation is skipped
         assignments = []
-
-        for book in self.data.books:
-            for supplier in self.data.suppliers:
-                for method in book.available_printing_methods:
-                    if (book.id, supplier.id, method) in self.x:
-                        if solver.Value(self.x[book.id, supplier.id, method]) == 1:
-                            unit_cost = self.cost_matrix[book.id, supplier.id, method]
-                            total_cost = unit_cost * book.production_volume
-
-                            assignments.append(Assignment(
-                                book_id=book.id,
-                                supplier_id=supplier.id,
-                                printing_method=method,
-                                production_volume=book.production_volume,
-                                unit_cost=unit_cost,
-                                total_cost=total_cost
-                            ))
-                            break  # Book assigned, move to next book
+        for i in chosen.tolist():
+            book, supplier, method, unit_cost = self._valid_triples[i]
+            assignments.append(Assignment.model_construct(
+                book_id=book.id,
+                supplier_id=supplier.id,
+                printing_method=method,
+                production_volume=book.production_volume,
+                unit_cost=unit_cost,
+                total_cost=unit_cost * book.production_volume
+            ))
 
         return assignments
 
@@ -376,20 +693,18 @@ class SupplierAllocationSolver:
         Returns:
             Dict mapping supplier_id -> {method -> utilization_percentage}
         """
-        utilization: Dict[str, Dict[str, float]] = {}
-
-        # Calculate volume used per supplier per method
-        volume_used: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
-
+        # Calculate volume used per (supplier, method)
+        volume_used: Counter = Counter()
         for assignment in assignments:
-            method = assignment.printing_method
-            volume_used[assignment.supplier_id][method] += assignment.production_volume
+            volume_used[assignment.supplier_id, assignment.printing_method] += (
+                assignment.production_volume
+            )
 
         # Calculate utilization percentages
-        for supplier in self.data.suppliers:
-            utilization[supplier.id] = {}
-            for method, capacity in supplier.capacities.items():
-                used = volume_used[supplier.id].get(method, 0)
-                utilization[supplier.id][method] = (used / capacity * 100) if capacity > 0 else 0.0
-
-        return utilization
+        return {
+            supplier.id: {
+                method: (volume_used[supplier.id, method] / capacity * 100) if capacity > 0 else 0.0
+                for method, capacity in supplier.capacities.items()
+            }
+            for supplier in self.data.suppliers
+        }
@@ -5,16 +5,49 @@ Validates that no brand has more than max_volumes_per_brand_per_supplier
 items (kits or standalone books) per supplier.
 """
 
-import json
-from collections import defaultdict
+import os
+import sys
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
+import orjson
+
+
+@lru_cache(maxsize=8)
+def _load_json(path: str, mtime_ns: int):
+    """Parse a JSON file (the mtime is part of the cache key, so edits are re-read)"""
+    return orjson.loads(Path(path).read_bytes())
+
+
+@lru_cache(maxsize=8)
+def _load_book_rows(path: str, mtime_ns: int):
+    """(book_id, brand, kit_id, book) per book of a books JSON file, in file order"""
+    return [
+        (book['id'], book['brand'], book.get('kit_id'), book)
+        for book in _load_json(path, mtime_ns)
+    ]
+
+
+@lru_cache(maxsize=8)
+def _load_kit_map(path: str, mtime_ns: int):
+    """Kit id -> kit for a kits JSON file"""
+    return {kit['id']: kit for kit in _load_json(path, mtime_ns)}
+
+
+def _mtime_ns(path: str) -> int:
+    """Modification time of a file in nanoseconds"""
+    return os.stat(path).st_mtime_ns
+
 
 def verify_brand_constraint(
     books_path: str,
     kits_path: str,
     solution_path: str,
-    max_items_per_brand: int = 4
+    max_items_per_brand: int = 4,
+    verbose: bool = False,
+    fast_fail: bool = False
 ):
     """
     Verify the brand diversification constraint
@@ -24,110 +57,129 @@ def verify_brand_constraint(
         kits_path: Path to kits JSON file
         solution_path: Path to solution JSON file
         max_items_per_brand: Maximum items (kits or standalone books) per brand per supplier
+        verbose: List the kits and books counted at every supplier (they are
+            always listed where the constraint is violated)
+        fast_fail: Only determine pass/fail: stop at the first violation and
+            print no report
     """
-    # Load data
-    with open(books_path, 'r') as f:
-        books = json.load(f)
-
-    with open(kits_path, 'r') as f:
-        kits = json.load(f)
-
-    with open(solution_path, 'r') as f:
-        solution = json.load(f)
-
-    # Build book and kit maps
-    book_map = {book['id']: book for book in books}
-    kit_map = {kit['id']: kit for kit in kits}
-
-    # Build assignment map: book_id -> supplier_id
-    assignments = {
-        assignment['book_id']: assignment['supplier_id']
-        for assignment in solution['assignments']
-    }
-
-    # Count items (kits + standalone books) per brand per supplier
-    brand_supplier_items = defaultdict(lambda: defaultdict(set))
+    # Load data. Books and kits rarely change between calls, so each file is parsed
+    # (and books unpacked into rows) once per file version. Kits are only needed
+    # to list kit details, so they are loaded on first use.
+    book_rows = _load_book_rows(str(books_path), _mtime_ns(books_path))
+    kit_map = None
+    solution = orjson.loads(Path(solution_path).read_bytes())
+
+    # Build assignment map: book_id -> supplier_id (used as is if the solution
+    # already stores its assignments keyed by book)
+    assignments = solution['assignments']
+    if not isinstance(assignments, dict):
+        assignments = {
+            assignment['book_id']: assignment['supplier_id']
+            for assignment in assignments
+        }
+
+    # Count kits and standalone books per (brand, supplier)
+    kit_counts = Counter()
+    book_counts = Counter()
+
+    # Counted kit ids and standalone books per (brand, supplier), for the listing
+    kit_ids_by_pair = {}
+    books_by_pair = {}
 
     # Track which kits have been processed
     processed_kits = set()
 
-    for book in books:
-        book_id = book['id']
-        brand = book['brand']
+    for book_id, brand, kit_id, book in book_rows:
         supplier = assignments.get(book_id)
 
         if supplier:
-            if book['kit_id']:
+            if kit_id:
                 # This book is in a kit
-                kit_id = book['kit_id']
                 if kit_id not in processed_kits:
                     # Add kit as one item (regardless of number of books)
-                    brand_supplier_items[brand][supplier].add(('kit', kit_id))
+                    kit_counts[brand, supplier] += 1
+                    kit_ids_by_pair.setdefault((brand, supplier), []).append(kit_id)
                     processed_kits.add(kit_id)
             else:
                 # Standalone book - each counts as one item
-                brand_supplier_items[brand][supplier].add(('book', book_id))
-
-    # Verify constraint and prepare report
-    print("="*80)
-    print("BRAND CONSTRAINT VERIFICATION")
-    print("="*80)
-    print(f"Maximum items per brand per supplier: {max_items_per_brand}")
-    print(f"(Note: A kit with N books counts as 1 item, not N items)\n")
+                book_counts[brand, supplier] += 1
+                books_by_pair.setdefault((brand, supplier), []).append(book)
+
+            if fast_fail and (
+                kit_counts[brand, supplier] + book_counts[brand, supplier] > max_items_per_brand
+            ):
+                return False
+
+    if fast_fail:
+        return True
+
+    # Verify constraint and prepare report (buffered and written once)
+    lines = [
+        "="*80,
+        "BRAND CONSTRAINT VERIFICATION",
+        "="*80,
+        f"Maximum items per brand per supplier: {max_items_per_brand}",
+        f"(Note: A kit with N books counts as 1 item, not N items)\n"
+    ]
 
     violations = []
 
-    for brand in sorted(brand_supplier_items.keys()):
-        print(f"\n{brand}:")
-        suppliers_data = brand_supplier_items[brand]
-
-        for supplier in sorted(suppliers_data.keys()):
-            items = suppliers_data[supplier]
-            num_items = len(items)
-
-            # Count kits and standalone books
-            num_kits = sum(1 for item_type, _ in items if item_type == 'kit')
-            num_books = sum(1 for item_type, _ in items if item_type == 'book')
-
-            status = "[OK]" if num_items <= max_items_per_brand else "[VIOLATION]"
-
-            print(f"  {supplier}: {num_items} items ({num_kits} kits + {num_books} standalone books) {status}")
-
-            # Show details
-            for item_type, item_id in sorted(items):
-                if item_type == 'kit':
-                    kit = kit_map[item_id]
-                    num_books_in_kit = len(kit['book_ids'])
-                    print(f"    - Kit {item_id}: {num_books_in_kit} books ({', '.join(kit['book_ids'])})")
-                else:
-                    book = book_map[item_id]
-                    print(f"    - Book {item_id}: {book['title']}")
-
-            if num_items > max_items_per_brand:
-                violations.append({
-                    'brand': brand,
-                    'supplier': supplier,
-                    'items': num_items,
-                    'limit': max_items_per_brand
-                })
+    # Sorted (brand, supplier) pairs; a brand header starts each brand's block
+    previous_brand = None
+    for brand, supplier in sorted(kit_ids_by_pair.keys() | books_by_pair.keys()):
+        if brand != previous_brand:
+            lines.append(f"\n{brand}:")
+            previous_brand = brand
+
+        num_kits = kit_counts[brand, supplier]
+        num_books = book_counts[brand, supplier]
+        num_items = num_kits + num_books
+
+        status = "[OK]" if num_items <= max_items_per_brand else "[VIOLATION]"
+
+        lines.append(
+            f"  {supplier}: {num_items} items ({num_kits} kits + {num_books} standalone books) {status}"
+        )
+
+        # Show details (always for violations): standalone books, then kits, each by id
+        if verbose or num_items > max_items_per_brand:
+            for book in sorted(books_by_pair.get((brand, supplier), ()), key=itemgetter('id')):
+                lines.append(f"    - Book {book['id']}: {book['title']}")
+            for kit_id in sorted(kit_ids_by_pair.get((brand, supplier), ())):
+                if kit_map is None:
+                    kit_map = _load_kit_map(str(kits_path), _mtime_ns(kits_path))
+                kit = kit_map[kit_id]
+                num_books_in_kit = len(kit['book_ids'])
+                lines.append(
+                    f"    - Kit {kit_id}: {num_books_in_kit} books ({', '.join(kit['book_ids'])})"
+                )
+
+        if num_items > max_items_per_brand:
+            violations.append({
+                'brand': brand,
+                'supplier': supplier,
+                'items': num_items,
+                'limit': max_items_per_brand
+            })
 
     # Summary
-    print("\n" + "="*80)
+    lines.append("\n" + "="*80)
     if violations:
-        print("CONSTRAINT VIOLATIONS DETECTED:")
-        print("="*80)
+        lines.append("CONSTRAINT VIOLATIONS DETECTED:")
+        lines.append("="*80)
         for v in violations:
-            print(f"  {v['brand']} at {v['supplier']}: {v['items']} items (limit: {v['limit']})")
-        print("\nVERIFICATION FAILED [X]")
+            lines.append(f"  {v['brand']} at {v['supplier']}: {v['items']} items (limit: {v['limit']})")
+        lines.append("\nVERIFICATION FAILED [X]")
     else:
-        print("VERIFICATION SUCCESSFUL [OK]")
-        print("="*80)
-        print("All brand constraints are satisfied!")
-        print("No brand has more than {} items (kits or standalone books) per supplier.".format(
+        lines.append("VERIFICATION SUCCESSFUL [OK]")
+        lines.append("="*80)
+        lines.append("All brand constraints are satisfied!")
+        lines.append("No brand has more than {} items (kits or standalone books) per supplier.".format(
             max_items_per_brand
         ))
 
-    print()
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return len(violations) == 0
 
@@ -1,79 +1,106 @@
 """
 Verify brand constraint in large dataset solution
+
+Usage: python verify_large_solution.py [--verbose]
 """
 
-import json
-from collections import defaultdict
-
-# Load data
-with open('data/test_large/books.json', 'r') as f:
-    books = json.load(f)
-
-with open('data/test_large/kits.json', 'r') as f:
-    kits = json.load(f)
-
-with open('data/test_large/config.json', 'r') as f:
-    config = json.load(f)
-
-with open('results/solution_large.json', 'r') as f:
-    solution = json.load(f)
-
-# Build maps
-book_map = {book['id']: book for book in books}
-kit_map = {kit['id']: kit for kit in kits}
-
-# Build assignment map
-assignments = {
-    assignment['book_id']: assignment['supplier_id']
-    for assignment in solution['assignments']
-}
-
-# Build books by brand
-books_by_brand = defaultdict(list)
-for book in books:
-    books_by_brand[book['brand']].append(book['id'])
-
-# Count items per brand per supplier
-brand_supplier_items = defaultdict(lambda: defaultdict(set))
-processed_kits = set()
-
-for book in books:
-    book_id = book['id']
-    brand = book['brand']
-    supplier = assignments.get(book_id)
-
-    if supplier:
-        if book.get('kit_id'):
-            kit_id = book['kit_id']
-            if kit_id not in processed_kits:
-                brand_supplier_items[brand][supplier].add(('kit', kit_id))
-                processed_kits.add(kit_id)
-        else:
-            brand_supplier_items[brand][supplier].add(('book', book_id))
-
-# Verify constraint
-max_items = config['max_volumes_per_brand_per_supplier']
-violations = []
-max_usage = 0
-
-print("="*80)
-print(f"BRAND CONSTRAINT VERIFICATION (max={max_items} items per brand per supplier)")
-print("="*80)
-
-for brand in sorted(brand_supplier_items.keys()):
-    print(f"\n{brand}:")
-    suppliers_data = brand_supplier_items[brand]
-
-    for supplier in sorted(suppliers_data.keys()):
-        items = suppliers_data[supplier]
-        num_items = len(items)
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import orjson
+
+
+def count_brand_items(
+    books: List[dict], assignments: Dict[str, str]
+) -> Tuple[Counter, Counter]:
+    """
+    Count kits and standalone books per (brand, supplier)
+
+    A kit counts once, under the brand of its first assigned book.
+
+    Returns:
+        (kit_counts, book_counts), both keyed by (brand, supplier_id)
+    """
+    kit_counts = Counter()
+    book_counts = Counter()
+    processed_kits = set()
+
+    for book in books:
+        book_id = book['id']
+        brand = book['brand']
+        supplier = assignments.get(book_id)
+
+        if supplier:
+            kit_id = book.get('kit_id')
+            if kit_id:
+                if kit_id not in processed_kits:
+                    kit_counts[brand, supplier] += 1
+                    processed_kits.add(kit_id)
+            else:
+                book_counts[brand, supplier] += 1
+
+    return kit_counts, book_counts
+
+
+def main(verbose: bool = False) -> Tuple[List[dict], int]:
+    """
+    Verify the brand constraint of results/solution_large.json
+
+    Args:
+        verbose: List the item counts of every brand at every supplier
+            (by default only the summary and any violations are printed)
+
+    Returns:
+        (violations, max_usage): the (brand, supplier) pairs over the limit, and
+        the largest item count of any brand at any supplier
+    """
+    # Load data
+    books = orjson.loads(Path('data/test_large/books.json').read_bytes())
+    config = orjson.loads(Path('data/test_large/config.json').read_bytes())
+    solution = orjson.loads(Path('results/solution_large.json').read_bytes())
+
+    # Build assignment map: book_id -> supplier_id (used as is if the solution
+    # already stores its assignments keyed by book)
+    assignments = solution['assignments']
+    if not isinstance(assignments, dict):
+        assignments = {
+            assignment['book_id']: assignment['supplier_id']
+            for assignment in assignments
+        }
+
+    kit_counts, book_counts = count_brand_items(books, assignments)
+
+    # Verify constraint (report buffered and written once)
+    max_items = config['max_volumes_per_brand_per_supplier']
+    violations = []
+    max_usage = 0
+
+    lines = [
+        "="*80,
+        f"BRAND CONSTRAINT VERIFICATION (max={max_items} items per brand per supplier)",
+        "="*80
+    ]
+
+    # Sorted (brand, supplier) pairs; a brand header starts each brand's block
+    brands = set()
+    for brand, supplier in sorted(kit_counts.keys() | book_counts.keys()):
+        if verbose and brand not in brands:
+            lines.append(f"\n{brand}:")
+        brands.add(brand)
+
+        num_kits = kit_counts[brand, supplier]
+        num_books = book_counts[brand, supplier]
+        num_items = num_kits + num_books
         max_usage = max(max_usage, num_items)
 
-        num_kits = sum(1 for item_type, _ in items if item_type == 'kit')
-        num_books = sum(1 for item_type, _ in items if item_type == 'book')
-
-        status = "[OK]" if num_items <= max_items else "[VIOLATION]"
-        print(f"  {supplier}: {num_items}/{max_items} items ({num_kits} kits + {num_books} standalone) {status}")
+        if verbose:
+            status = "[OK]" if num_items <= max_items else "[VIOLATION]"
+            lines.append(
+                f"  {supplier}: {num_items}/{max_items} items "
+                f"({num_kits} kits + {num_books} standalone) {status}"
+            )
 
         if num_items > max_items:
             violations.append({
@@ -83,19 +110,26 @@ for brand in sorted(brand_supplier_items.keys()):
                 'limit': max_items
             })
 
-print("\n" + "="*80)
-print("SUMMARY")
-print("="*80)
-print(f"Max items allowed per brand per supplier: {max_items}")
-print(f"Max items actually used: {max_usage}")
-print(f"Constraint headroom: {max_items - max_usage} items")
-
-if violations:
-    print(f"\n[VIOLATION] Found {len(violations)} violation(s)!")
-    for v in violations:
-        print(f"  {v['brand']} at {v['supplier']}: {v['items']} > {v['limit']}")
-else:
-    print("\n[OK] All brand constraints satisfied!")
-    print(f"All {len(brand_supplier_items)} brands comply with the constraint.")
-
-print("="*80)
+    lines.append("\n" + "="*80)
+    lines.append("SUMMARY")
+    lines.append("="*80)
+    lines.append(f"Max items allowed per brand per supplier: {max_items}")
+    lines.append(f"Max items actually used: {max_usage}")
+    lines.append(f"Constraint headroom: {max_items - max_usage} items")
+
+    if violations:
+        lines.append(f"\n[VIOLATION] Found {len(violations)} violation(s)!")
+        for v in violations:
+            lines.append(f"  {v['brand']} at {v['supplier']}: {v['items']} > {v['limit']}")
+    else:
+        lines.append("\n[OK] All brand constraints satisfied!")
+        lines.append(f"All {len(brands)} brands comply with the constraint.")
+
+    lines.append("="*80)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    return violations, max_usage
+
+
+if __name__ == "__main__":
+    main(verbose="--verbose" in sys.argv[1:])